@@ -109,6 +109,9 @@ def ingest(
     url: Optional[str] = typer.Option(None, "--url", help="Topolograph API URL"),
     token: Optional[str] = typer.Option(None, "--token", "-t", help="API token"),
     upload: bool = typer.Option(False, "--upload", "-u", help="Upload collected LSDB to Topolograph"),
+    max_concurrency: Optional[int] = typer.Option(
+        None, "--max-concurrency", "-c", help="Maximum hosts collected from at once (default: 64)"
+    ),
 ):
     """Collect LSDB data from network devices and optionally upload to Topolograph."""
     inventory_path = Path(inventory)
@@ -118,7 +121,7 @@ def ingest(
         sys.exit(1)
     
     try:
-        collector = TopologyCollector(str(inventory_path))
+        collector = TopologyCollector(str(inventory_path), max_concurrency=max_concurrency)
         console.print(f"[cyan]Collecting topology data from {len(collector.inventory)} host(s)...[/cyan]")
         
         result = collector.collect(protocol=protocol)
@@ -0,0 +1,77 @@
+import requests
+
+from topolograph import Topolograph
+
+
+def test_default_session_mounts_pooled_retrying_adapter():
+    client = Topolograph('http://localhost:8080', token='secret')
+
+    adapter = client.session.get_adapter('https://localhost:8080/api/graph/')
+
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == 3
+    assert client.session.headers['Authorization'] == 'Bearer secret'
+
+
+def test_user_supplied_session_is_used_as_is():
+    session = requests.Session()
+
+    client = Topolograph('http://localhost:8080', token='secret', session=session)
+
+    assert client.session is session
+    assert session.headers['Authorization'] == 'Bearer secret'
+
+
+def test_decode_parses_body_and_falls_back_on_non_strict_json():
+    client = Topolograph('http://localhost:8080', token='secret')
+    response = requests.Response()
+
+    response._content = b'{"hosts": {"count": 3}}'
+    assert client.decode(response) == {'hosts': {'count': 3}}
+
+    response._content = b'{"cost": NaN}'
+    cost = client.decode(response)['cost']
+    assert cost != cost
+
+
+def test_default_retry_covers_gateway_errors():
+    client = Topolograph('http://localhost:8080', token='secret')
+
+    retry = client.session.get_adapter('http://localhost:8080/api/graph/').max_retries
+
+    assert set(retry.status_forcelist) == {502, 503, 504}
+    assert retry.respect_retry_after_header
+    assert not retry.raise_on_status
+
+
+def test_close_stops_keepalive_thread():
+    session = requests.Session()
+    heads = []
+    session.head = lambda url, **kwargs: heads.append(url)
+
+    client = Topolograph('http://localhost:8080', session=session, keepalive=0.01)
+    thread = client._keepalive_thread
+    thread.join(0.1)
+    client.close()
+
+    assert not thread.is_alive()
+    assert heads and set(heads) == {'http://localhost:8080'}
+
+
+def test_accept_encoding_is_only_filled_in_when_missing():
+    custom = requests.Session()
+    custom.headers['Accept-Encoding'] = 'identity'
+    stripped = requests.Session()
+    stripped.headers.pop('Accept-Encoding')
+
+    Topolograph('http://localhost:8080', session=custom)
+    Topolograph('http://localhost:8080', session=stripped)
+
+    assert custom.headers['Accept-Encoding'] == 'identity'
+    assert 'gzip' in stripped.headers['Accept-Encoding']
+
+
+def test_pool_maxsize_is_configurable():
+    client = Topolograph('http://localhost:8080', pool_maxsize=64)
+
+    assert client.session.get_adapter('http://localhost:8080/api/graph/')._pool_maxsize == 64
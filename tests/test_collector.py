@@ -0,0 +1,265 @@
+import asyncio
+
+import pytest
+
+from topolograph.collector.collector import TopologyCollector
+from topolograph.collector.pool import ConnectionPool
+
+
+class _Response:
+    def __init__(self, channel_input, result, failed=False):
+        self.channel_input = channel_input
+        self.result = result
+        self.failed = failed
+
+
+class _Driver:
+    def __init__(self, host, log):
+        self.host = host
+        self.log = log
+
+    async def __aenter__(self):
+        self.log.append(('open', self.host.name))
+        return self
+
+    async def __aexit__(self, *exc):
+        self.log.append(('close', self.host.name))
+
+    async def send_commands(self, commands):
+        self.log.append(('send', self.host.name, tuple(commands)))
+        return [_Response(command, f'{self.host.name}: {command}') for command in commands]
+
+
+def _write_inventory(tmp_path, hosts):
+    lines = []
+    for name, vendor, protocol in hosts:
+        lines += [
+            f'{name}:',
+            f'  hostname: {name}.lab',
+            '  username: admin',
+            '  password: admin',
+            f'  vendor: {vendor}',
+            f'  protocol: {protocol}',
+        ]
+    path = tmp_path / 'inventory.yaml'
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+
+def _collector(tmp_path, hosts, log):
+    collector = TopologyCollector(_write_inventory(tmp_path, hosts))
+    collector._build_driver = lambda host: _Driver(host, log)
+    return collector
+
+
+def test_collect_aggregates_outputs_in_inventory_order(tmp_path):
+    log = []
+    collector = _collector(tmp_path, [('r1', 'frr', 'isis'), ('r2', 'cisco', 'isis')], log)
+
+    result = collector.collect()
+
+    assert result.errors == []
+    assert [h.hostname for h in result.host_results] == ['r1.lab', 'r2.lab']
+    assert all(h.success for h in result.host_results)
+    assert result.host_results[0].outputs == {
+        'show isis database detail': 'r1: show isis database detail'}
+    assert result.raw_lsdb_text == (
+        '=== r1 - show isis database detail ===\nr1: show isis database detail\n\n'
+        '=== r2 - show isis database detail ===\nr2: show isis database detail\n'
+    )
+
+
+def test_collect_reports_unsupported_vendor_without_connecting(tmp_path):
+    log = []
+    collector = _collector(tmp_path, [('r1', 'acme', 'ospf'), ('r2', 'frr', 'isis')], log)
+
+    result = collector.collect()
+
+    failed, ok = result.host_results
+    assert not failed.success and failed.commands == []
+    assert "Vendor 'acme' not found" in failed.error
+    assert result.errors[0].startswith('r1: ')
+    assert ok.success
+    assert all(entry[1] == 'r2' for entry in log)
+
+
+def test_collect_without_hosts_returns_error(tmp_path):
+    collector = _collector(tmp_path, [('r1', 'frr', 'isis')], [])
+
+    result = collector.collect(protocol='ospf')
+
+    assert result.host_results == []
+    assert result.errors == ['No hosts found in inventory']
+
+
+def test_collect_sends_all_commands_in_one_batch(tmp_path):
+    log = []
+    collector = _collector(tmp_path, [('r1', 'cisco', 'ospf')], log)
+
+    result = collector.collect()
+
+    sends = [entry for entry in log if entry[0] == 'send']
+    assert sends == [('send', 'r1', (
+        'show ip ospf database router',
+        'show ip ospf database network',
+        'show ip ospf database external',
+    ))]
+    assert result.host_results[0].commands == list(sends[0][2])
+
+
+class _PoolDriver(_Driver):
+    def __init__(self, host, log):
+        super().__init__(host, log)
+        self.alive = False
+
+    async def open(self):
+        self.alive = True
+        self.log.append(('open', self.host.name))
+
+    async def close(self):
+        self.alive = False
+        self.log.append(('close', self.host.name))
+
+    def isalive(self):
+        return self.alive
+
+
+def test_collect_reuses_pooled_connections_within_one_loop(tmp_path):
+    log = []
+    pool = ConnectionPool()
+    collector = TopologyCollector(_write_inventory(tmp_path, [('r1', 'frr', 'isis')]), pool=pool)
+    collector._build_driver = lambda host: _PoolDriver(host, log)
+
+    async def collect_twice():
+        await collector.collect_async()
+        await collector.collect_async()
+        assert len(pool) == 1
+        await pool.close()
+
+    asyncio.run(collect_twice())
+
+    assert [entry[0] for entry in log] == ['open', 'send', 'send', 'close']
+
+
+def test_sync_collect_closes_pooled_connections_before_its_loop_ends(tmp_path):
+    log = []
+    pool = ConnectionPool()
+    collector = TopologyCollector(_write_inventory(tmp_path, [('r1', 'frr', 'isis')]), pool=pool)
+    collector._build_driver = lambda host: _PoolDriver(host, log)
+
+    collector.collect()
+    collector.collect()
+
+    assert [entry[0] for entry in log] == ['open', 'send', 'close', 'open', 'send', 'close']
+    assert len(pool) == 0
+
+
+class _FakeHost:
+    def __init__(self, name):
+        self.name = name
+
+
+class _SlowCloseDriver(_PoolDriver):
+    async def close(self):
+        await asyncio.sleep(0)
+        await super().close()
+
+
+def test_pool_never_hands_one_connection_to_concurrent_checkouts():
+    log = []
+    pool = ConnectionPool(idle_timeout=60)
+
+    def factory(name):
+        return lambda: _SlowCloseDriver(_FakeHost(name), log)
+
+    async def use(key, name, seen):
+        async with pool.connection(key, factory(name)) as driver:
+            seen.append(driver)
+            await asyncio.sleep(0)
+
+    async def scenario():
+        await use('a', 'a', [])
+        await use('b', 'b', [])
+        pool._idle['a'][0].last_used -= 120  # Expired: closing it yields to the loop
+        seen = []
+        await asyncio.gather(use('b', 'b', seen), use('b', 'b', seen))
+        return seen
+
+    first, second = asyncio.run(scenario())
+
+    assert first is not second
+    assert log.count(('close', 'a')) == 1
+
+
+def test_build_driver_passes_connection_options(tmp_path):
+    path = tmp_path / 'inventory.yaml'
+    path.write_text(
+        'r1:\n  hostname: 10.0.0.1\n  username: admin\n  password: secret\n'
+        '  vendor: cisco\n  protocol: ospf\n  port: 2222\n'
+        '  connection_options:\n    auth_strict_key: false\n    timeout_ops: 120\n'
+    )
+    collector = TopologyCollector(str(path))
+
+    driver = collector._build_driver(collector.inventory.hosts[0])
+
+    assert driver.host == '10.0.0.1'
+    assert driver.port == 2222
+    assert driver.auth_strict_key is False
+    assert driver.timeout_ops == 120
+
+
+def test_build_driver_accepts_empty_connection_options(tmp_path):
+    path = tmp_path / 'inventory.yaml'
+    path.write_text(
+        'r1:\n  hostname: 10.0.0.1\n  username: admin\n  password: secret\n'
+        '  vendor: cisco\n  protocol: ospf\n  connection_options:\n'
+    )
+    collector = TopologyCollector(str(path))
+
+    driver = collector._build_driver(collector.inventory.hosts[0])
+
+    assert driver.host == '10.0.0.1'
+
+
+def test_concurrency_is_capped_by_host_count_and_environment(tmp_path, monkeypatch):
+    collector = _collector(tmp_path, [('r1', 'frr', 'isis')], [])
+
+    monkeypatch.delenv('TOPOLOGRAPH_MAX_CONCURRENCY', raising=False)
+    assert collector._concurrency_for(3) == 3
+    assert collector._concurrency_for(500) == 64
+
+    monkeypatch.setenv('TOPOLOGRAPH_MAX_CONCURRENCY', '100')
+    assert collector._concurrency_for(500) == 100
+
+    collector.max_concurrency = 8
+    assert collector._concurrency_for(500) == 8
+
+
+def test_invalid_concurrency_environment_variable_is_reported(tmp_path, monkeypatch):
+    collector = _collector(tmp_path, [('r1', 'frr', 'isis')], [])
+
+    monkeypatch.setenv('TOPOLOGRAPH_MAX_CONCURRENCY', '')
+    assert collector._concurrency_for(500) == 64
+
+    monkeypatch.setenv('TOPOLOGRAPH_MAX_CONCURRENCY', 'abc')
+    with pytest.raises(ValueError, match="TOPOLOGRAPH_MAX_CONCURRENCY must be an integer"):
+        collector._concurrency_for(500)
+
+
+def test_collect_resolves_registry_commands_once_per_host(tmp_path, monkeypatch):
+    from topolograph.collector import collector as collector_module
+
+    lookups = []
+    real_get_commands = collector_module.get_commands
+
+    def counting_get_commands(protocol, vendor):
+        lookups.append((protocol, vendor))
+        return real_get_commands(protocol, vendor)
+
+    monkeypatch.setattr(collector_module, 'get_commands', counting_get_commands)
+    collector = _collector(tmp_path, [('r1', 'frr', 'isis'), ('r2', 'cisco', 'ospf')], [])
+
+    result = collector.collect()
+
+    assert lookups == [('isis', 'frr'), ('ospf', 'cisco')]
+    assert result.host_results[1].commands == list(real_get_commands('ospf', 'cisco'))
@@ -0,0 +1,113 @@
+import io
+import json
+
+import pytest
+import urllib3
+
+from topolograph.exceptions import APIError
+from topolograph.resources import event as event_module
+from topolograph.resources.event import EventsManager
+
+
+class _Response:
+    def __init__(self, body):
+        self.body = body
+        self.raw = io.BytesIO(json.dumps(body).encode())
+        self.closed = False
+
+    def json(self):
+        return self.body
+
+    def close(self):
+        self.closed = True
+
+
+class _Client:
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.calls = []
+
+    def decode(self, response):
+        return response.json()
+
+    def get(self, path, **kwargs):
+        self.calls.append((path, kwargs))
+        return _Response(self.bodies[path])
+
+
+def test_get_all_events_merges_network_and_adjacency_events():
+    client = _Client({
+        '/events/graph-time/networks': {
+            'network_up_down_events': [{'event_name': 'network_down', 'extra': 1}],
+        },
+        '/events/graph-time/adjacency': {
+            'single_host_down_events': [{'event_name': 'host_down'}],
+        },
+    })
+    events = EventsManager(client, 'graph-time')
+
+    result = events.get_all_events(last_minutes=30)
+
+    assert sorted(client.calls) == [
+        ('/events/graph-time/adjacency', {'params': {'last_minutes': 30}, 'stream': True}),
+        ('/events/graph-time/networks', {'params': {'last_minutes': 30}, 'stream': True}),
+    ]
+    assert sorted(result) == [
+        'adjacency_cost_change_events', 'all_host_up_down_events',
+        'network_cost_change_events', 'network_up_down_events',
+        'single_host_down_events', 'single_host_up_events',
+    ]
+    network_down, = result['network_up_down_events']
+    assert network_down.event_name == 'network_down'
+    assert network_down.attributes == {'extra': 1}
+    assert result['single_host_down_events'][0].event_name == 'host_down'
+
+
+NETWORK_BODY = {
+    'network_up_down_events': [
+        {'event_name': 'network_down', 'event_object': '10.0.0.0/24', 'nested': {'a': [1, 2]}},
+        {'event_name': 'network_up', 'event_object': '10.0.0.0/24'},
+    ],
+    'network_cost_change_events': [{'event_name': 'cost_change', 'new_cost': 2.5}],
+}
+
+
+def _iter_network_events(monkeypatch, ijson):
+    monkeypatch.setattr(event_module, 'ijson', ijson)
+    client = _Client({'/events/graph-time/networks': NETWORK_BODY})
+    return [(key, e.event_name, e.new_cost, e.attributes)
+            for key, e in EventsManager(client, 'graph-time').iter_network_events()]
+
+
+EXPECTED_NETWORK_EVENTS = [
+    ('network_up_down_events', 'network_down', None, {'nested': {'a': [1, 2]}}),
+    ('network_up_down_events', 'network_up', None, {}),
+    ('network_cost_change_events', 'cost_change', 2.5, {}),
+]
+
+
+def test_iter_network_events_without_ijson(monkeypatch):
+    assert _iter_network_events(monkeypatch, None) == EXPECTED_NETWORK_EVENTS
+
+
+def test_iter_network_events_with_ijson(monkeypatch):
+    ijson = pytest.importorskip('ijson')
+    assert _iter_network_events(monkeypatch, ijson) == EXPECTED_NETWORK_EVENTS
+
+
+class _ResetStream(io.RawIOBase):
+    def readinto(self, buffer):
+        raise urllib3.exceptions.ProtocolError('Connection broken: reset by peer')
+
+
+def test_stream_read_errors_surface_as_api_error(monkeypatch):
+    ijson = pytest.importorskip('ijson')
+    monkeypatch.setattr(event_module, 'ijson', ijson)
+    response = _Response({})
+    response.raw = _ResetStream()
+    client = _Client({})
+    client.get = lambda path, **kwargs: response
+
+    with pytest.raises(APIError, match='Connection broken'):
+        EventsManager(client, 'graph-time').get_network_events()
+    assert response.closed
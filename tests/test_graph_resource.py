@@ -0,0 +1,98 @@
+from topolograph.resources.graph import GraphsManager
+
+
+class _Response:
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class _Client:
+    def __init__(self, body):
+        self.body = body
+        self.calls = []
+
+    def decode(self, response):
+        return response.json()
+
+    def get(self, path, **kwargs):
+        self.calls.append((path, kwargs))
+        return _Response(self.body)
+
+    def delete(self, path, **kwargs):
+        self.calls.append((path, kwargs))
+
+
+def test_list_ids_requests_graph_time_only():
+    client = _Client({'items': [{'graph_time': 'g1'}, {'graph_time': 'g2'}]})
+
+    assert GraphsManager(client).list_ids(protocol='isis') == ['g1', 'g2']
+    assert client.calls == [('/graph/', {'params': {
+        'page': 1, 'per_page': 50, 'protocol': 'isis', 'fields': 'graph_time',
+    }})]
+
+
+def test_list_omits_fields_param_by_default():
+    client = _Client([{'graph_time': 'g1', 'protocol': 'ospf'}])
+
+    graphs = GraphsManager(client).list()
+
+    assert [g.protocol for g in graphs] == ['ospf']
+    assert 'fields' not in client.calls[0][1]['params']
+
+
+def test_graph_summary_fields_default_when_not_returned():
+    graphs = GraphsManager(_Client([
+        {'graph_time': 'g1', 'hosts': {'count': 3}},
+        {'graph_time': 'g2'},
+    ])).list(fields=['graph_time', 'hosts'])
+
+    assert graphs[0].hosts == {'count': 3}
+    assert graphs[1].hosts == {}
+    assert graphs[1].networks_data == {}
+    assert graphs[1].areas == []
+
+
+def test_get_by_time_is_cached_until_invalidated_or_deleted():
+    client = _Client({'graph_time': 'g1', 'protocol': 'ospf'})
+    manager = GraphsManager(client, cache_ttl=300)
+
+    first = manager.get_by_time('g1')
+    assert manager.get_by_time('g1') is first
+    assert len(client.calls) == 1
+
+    manager.invalidate('g1')
+    assert manager.get_by_time('g1') is not first
+    assert len(client.calls) == 2
+
+    manager.delete('g1')
+    manager.get_by_time('g1')
+    assert [path for path, _ in client.calls] == ['/graph/g1'] * 4
+
+
+def test_get_by_time_is_not_cached_by_default():
+    client = _Client({'graph_time': 'g1'})
+    manager = GraphsManager(client)
+
+    manager.get_by_time('g1')
+    manager.get_by_time('g1')
+
+    assert len(client.calls) == 2
+
+
+def test_get_by_time_cache_evicts_least_recently_used_and_expired(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('topolograph.resources.graph.time.monotonic', lambda: clock[0])
+    manager = GraphsManager(_Client({'graph_time': 'g'}), cache_ttl=60, cache_maxsize=2)
+
+    manager.get_by_time('g1')
+    manager.get_by_time('g2')
+    manager.get_by_time('g1')
+    manager.get_by_time('g3')
+    assert list(manager._cache) == ['g1', 'g3']
+
+    clock[0] += 61
+    manager.get_by_time('g4')
+    assert list(manager._cache) == ['g4']
@@ -0,0 +1,94 @@
+import json
+import os
+
+from topolograph.collector import inventory as inventory_module
+from topolograph.collector.inventory import Inventory
+
+
+INVENTORY = '''router1:
+  hostname: 10.0.0.1
+  username: admin
+  password: admin
+  vendor: cisco
+  protocol: ospf
+'''
+
+
+def test_inventory_is_cached_as_json_sidecar(tmp_path):
+    path = tmp_path / 'inventory.yaml'
+    path.write_text(INVENTORY)
+
+    first = Inventory(str(path))
+    assert first.cache_path.exists()
+
+    # A fresh cache is used instead of re-parsing the YAML
+    first.cache_path.write_text(first.cache_path.read_text().replace('10.0.0.1', '10.9.9.9'))
+    assert Inventory(str(path)).hosts[0].hostname == '10.9.9.9'
+
+
+def test_inventory_cache_is_private_to_its_owner(tmp_path):
+    path = tmp_path / 'inventory.yaml'
+    path.write_text(INVENTORY)
+    path.chmod(0o644)
+
+    cache_path = Inventory(str(path)).cache_path
+
+    assert cache_path.stat().st_mode & 0o777 == 0o600
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['inventory.yaml', cache_path.name]
+
+
+def test_inventory_cache_is_invalidated_when_source_changes(tmp_path):
+    path = tmp_path / 'inventory.yaml'
+    path.write_text(INVENTORY)
+    Inventory(str(path))
+
+    path.write_text(INVENTORY.replace('10.0.0.1', '10.0.0.254'))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert Inventory(str(path)).hosts[0].hostname == '10.0.0.254'
+
+
+def test_inventory_cache_from_another_format_is_ignored(tmp_path, monkeypatch):
+    path = tmp_path / 'inventory.yaml'
+    path.write_text(INVENTORY)
+    cache_path = Inventory(str(path)).cache_path
+    cache_path.write_text(cache_path.read_text().replace('10.0.0.1', '10.9.9.9'))
+
+    monkeypatch.setattr(inventory_module, '_CACHE_FORMAT', inventory_module._CACHE_FORMAT + 1)
+
+    assert Inventory(str(path)).hosts[0].hostname == '10.0.0.1'
+    assert json.loads(cache_path.read_text())['format'] == inventory_module._CACHE_FORMAT
+
+
+def test_get_hosts_filters_by_protocol_and_vendor(tmp_path):
+    path = tmp_path / 'inventory.yaml'
+    path.write_text(
+        INVENTORY
+        + INVENTORY.replace('router1', 'router2').replace('ospf', 'isis')
+        + INVENTORY.replace('router1', 'router3').replace('cisco', 'juniper')
+    )
+    inventory = Inventory(str(path))
+
+    def names(hosts):
+        return [h.name for h in hosts]
+
+    assert names(inventory.get_hosts()) == ['router1', 'router2', 'router3']
+    assert names(inventory.get_hosts(protocol='OSPF')) == ['router1', 'router3']
+    assert names(inventory.get_hosts(vendor='cisco')) == ['router1', 'router2']
+    assert names(inventory.get_hosts(protocol='ospf', vendor='Juniper')) == ['router3']
+    assert inventory.get_hosts(protocol='ospfv3') == []
+
+
+def test_empty_inventory_file_has_no_hosts(tmp_path):
+    path = tmp_path / 'inventory.yaml'
+    path.write_text('# no devices yet\n')
+
+    inventory = Inventory(str(path))
+
+    assert not inventory
+    assert len(inventory) == 0
+    assert inventory.get_hosts(protocol='ospf') == []
+
+    # The empty result is cached too, not re-parsed on every load
+    assert json.loads(inventory.cache_path.read_text())['data'] == {}
@@ -13,6 +13,9 @@ class _Client:
     def __init__(self):
         self.calls = []
 
+    def decode(self, response):
+        return response.json()
+
     def _call(self, method, path, **kwargs):
         self.calls.append((method, path, kwargs))
         return _Response({'ok': True})
@@ -4,6 +4,7 @@ flask-visual repo): cspf_path, edges_list(include=), lsps_list filters,
 paths.shortest(with_lsps=), paths.edge_failure_reaction.
 """
 from topolograph.resources.graph import Graph
+from topolograph.resources.path import Path
 
 
 class _Response:
@@ -18,6 +19,9 @@ class _Client:
     def __init__(self):
         self.calls = []
 
+    def decode(self, response):
+        return response.json()
+
     def _call(self, method, path, **kwargs):
         self.calls.append((method, path, kwargs))
         return _Response({'ok': True})
@@ -137,3 +141,37 @@ def test_paths_edge_failure_reaction():
             'failed_edges_list': [['R1', 'R2']],
         }}),
     ]
+
+
+def test_path_stores_node_lists_as_tuples():
+    path = Path({
+        'spt_path_nodes_name_as_ll_in_ll': [['R1', 'R2', 'R3'], ['R1', 'R4', 'R3']],
+        'cost': 20,
+    })
+
+    assert path.paths == (('R1', 'R2', 'R3'), ('R1', 'R4', 'R3'))
+    assert path.unbackup_paths == ()
+    assert ' -> '.join(path.paths[0]) == 'R1 -> R2 -> R3'
+
+
+def test_paths_edge_failure_reaction_sends_list_pairs_as_is():
+    client = _Client()
+    graph = Graph(client, {'graph_time': 'graph-time'})
+    failed_edges = [['R1', 'R2'], ['R2', 'R3']]
+
+    graph.paths.edge_failure_reaction(failed_edges)
+
+    assert client.calls[0][2]['json']['failed_edges_list'] is failed_edges
+
+
+def test_paths_shortest_many_keeps_pair_order():
+    client = _Client()
+    graph = Graph(client, {'graph_time': 'graph-time'})
+
+    paths = graph.paths.shortest_many([('R1', 'R2'), ('R1', 'R3')], with_lsps=True)
+
+    assert len(paths) == 2
+    assert sorted(call[1] for call in client.calls) == [
+        '/graph/graph-time/path/R1/R2', '/graph/graph-time/path/R1/R3',
+    ]
+    assert all(call[2] == {'params': {'with_lsps': 'true'}} for call in client.calls)
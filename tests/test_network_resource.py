@@ -0,0 +1,54 @@
+import pytest
+
+from topolograph.exceptions import APIError, NotFoundError
+from topolograph.resources.network import NetworksManager
+
+
+class _Response:
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class _Client:
+    def __init__(self, networks):
+        self.networks = networks
+
+    def decode(self, response):
+        return response.json()
+
+    def get(self, path, params=None, **kwargs):
+        ip_address = params['ip_address']
+        if ip_address == '10.0.9.9':
+            raise APIError('API request failed with status 500', status_code=500)
+        if ip_address not in self.networks:
+            raise NotFoundError(f'Resource not found: {path}', status_code=404)
+        return _Response(self.networks[ip_address])
+
+
+NETWORKS = {
+    '10.0.0.1': {'10.0.0.0/24': [{'rid': '1.1.1.1', 'cost': 10}]},
+    '10.0.1.1': {},
+}
+
+
+def test_find_by_ips_keys_results_by_ip_and_maps_not_found_to_empty():
+    manager = NetworksManager(_Client(NETWORKS), 'graph-time')
+
+    found = manager.find_by_ips(['10.0.0.1', '10.0.1.1', '10.0.2.1'])
+
+    assert list(found) == ['10.0.0.1', '10.0.1.1', '10.0.2.1']
+    assert [n.network for n in found['10.0.0.1']] == ['10.0.0.0/24']
+    assert found['10.0.1.1'] == []
+    assert found['10.0.2.1'] == []
+
+
+def test_find_by_ips_propagates_other_failures():
+    manager = NetworksManager(_Client(NETWORKS), 'graph-time')
+
+    with pytest.raises(APIError) as excinfo:
+        manager.find_by_ips(['10.0.0.1', '10.0.9.9'])
+
+    assert excinfo.value.status_code == 500
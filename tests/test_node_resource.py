@@ -0,0 +1,130 @@
+import asyncio
+
+from topolograph.exceptions import NotFoundError
+from topolograph.resources.node import Node, NodesManager
+
+
+class _Response:
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class _Client:
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def decode(self, response):
+        return response.json()
+
+    def get(self, path, **kwargs):
+        node_id = int(path.rsplit('/', 1)[1])
+        if node_id not in self.nodes:
+            raise NotFoundError(f'Resource not found: {path}', status_code=404)
+        return _Response(dict(self.nodes[node_id]))
+
+
+def test_get_many_by_ids_keeps_order_and_maps_failures_to_none():
+    manager = NodesManager(_Client({1: {'name': 'R1'}, 2: {'name': 'R2'}}), 'graph-time')
+
+    nodes = manager.get_many_by_ids([2, 404, 1])
+
+    assert [(n.id, n.name) if n else None for n in nodes] == [(2, 'R2'), None, (1, 'R1')]
+
+
+def test_get_many_by_ids_async():
+    manager = NodesManager(_Client({1: {'name': 'R1'}}), 'graph-time')
+
+    nodes = asyncio.run(manager.get_many_by_ids_async([1, 7]))
+
+    assert nodes[0].name == 'R1' and nodes[1] is None
+
+
+def test_node_exposes_raw_fields_lazily():
+    node = Node({'id': 1, 'name': 'R1', 'location': 'dc1'})
+
+    assert node.location == 'dc1'
+    assert node.attributes == {'location': 'dc1'}
+    assert node.attributes is node.attributes
+    assert not hasattr(node, 'role')
+    assert not hasattr(node, '__dict__')
+
+    node.attributes = {'location': 'dc2'}
+    assert node.attributes == {'location': 'dc2'}
+
+
+class _PagedClient:
+    def __init__(self, node_count, max_per_page=None, with_total_pages=True,
+                 with_total=True, ignore_page=False):
+        self.node_count = node_count
+        self.max_per_page = max_per_page
+        self.with_total_pages = with_total_pages
+        self.with_total = with_total
+        self.ignore_page = ignore_page
+        self.pages = []
+
+    def decode(self, response):
+        return response.json()
+
+    def get(self, path, params=None, **kwargs):
+        page, per_page = params['page'], params['per_page']
+        if self.max_per_page:
+            per_page = min(per_page, self.max_per_page)
+        self.pages.append(page)
+        start = 0 if self.ignore_page else (page - 1) * per_page
+        items = [{'node_id': i} for i in range(start, min(start + per_page, self.node_count))]
+        pagination = {'page': page, 'per_page': per_page}
+        if self.with_total:
+            pagination['total'] = self.node_count
+        if self.with_total_pages:
+            pagination['total_pages'] = -(-self.node_count // per_page)
+        return _Response({'items': items, 'pagination': pagination})
+
+
+def test_iter_walks_pages_lazily_and_stops_at_last_page():
+    client = _PagedClient(node_count=4)
+    nodes = NodesManager(client, 'graph-time').iter(batch_size=2)
+
+    assert next(nodes) == {'node_id': 0}
+    assert client.pages == [1]
+    assert [n['node_id'] for n in nodes] == [1, 2, 3]
+    assert client.pages == [1, 2]
+
+
+def test_iter_follows_total_pages_when_server_clamps_per_page():
+    client = _PagedClient(node_count=5, max_per_page=2)
+
+    nodes = list(NodesManager(client, 'graph-time').iter(batch_size=500))
+
+    assert [n['node_id'] for n in nodes] == [0, 1, 2, 3, 4]
+    assert client.pages == [1, 2, 3]
+
+
+def test_iter_stops_on_short_page_without_total_pages():
+    client = _PagedClient(node_count=3, with_total_pages=False)
+
+    nodes = list(NodesManager(client, 'graph-time').iter(batch_size=2))
+
+    assert [n['node_id'] for n in nodes] == [0, 1, 2]
+    assert client.pages == [1, 2]
+
+
+def test_iter_stops_once_total_items_were_yielded():
+    client = _PagedClient(node_count=4, with_total_pages=False)
+
+    nodes = list(NodesManager(client, 'graph-time').iter(batch_size=2))
+
+    assert [n['node_id'] for n in nodes] == [0, 1, 2, 3]
+    assert client.pages == [1, 2]
+
+
+def test_iter_stops_when_server_ignores_page_parameter():
+    client = _PagedClient(node_count=10, max_per_page=3, with_total_pages=False,
+                          with_total=False, ignore_page=True)
+
+    nodes = list(NodesManager(client, 'graph-time').iter(batch_size=3))
+
+    assert [n['node_id'] for n in nodes] == [0, 1, 2]
+    assert client.pages == [1, 2]
@@ -0,0 +1,64 @@
+import pytest
+
+from topolograph.exceptions import APIError, PartialUploadError
+from topolograph.upload.uploader import Uploader
+
+
+class _Response:
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class _Client:
+    def __init__(self):
+        self.payloads = []
+
+    def decode(self, response):
+        return response.json()
+
+    def post(self, path, json=None, **kwargs):
+        assert path == '/graph/'
+        self.payloads.append(json)
+        if json['lsdb_output'] == 'broken':
+            raise APIError('Unable to parse LSDB', status_code=500)
+        return _Response({'graph_time': json['lsdb_output'], 'protocol': json['igp_protocol']})
+
+
+def test_upload_many_posts_each_lsdb_and_keeps_order():
+    client = _Client()
+    uploader = Uploader(client)
+
+    graphs = uploader.upload_many([
+        {'lsdb_text': 'lsdb-1', 'vendor': 'frr', 'protocol': 'isis'},
+        {'lsdb_text': 'lsdb-2', 'vendor': 'Cisco', 'protocol': 'ospf', 'watcher_name': 'w'},
+    ])
+
+    assert [g.graph_time for g in graphs] == ['lsdb-1', 'lsdb-2']
+    assert sorted(client.payloads, key=lambda p: p['lsdb_output']) == [
+        {'lsdb_output': 'lsdb-1', 'vendor_device': 'FRR', 'igp_protocol': 'isis'},
+        {'lsdb_output': 'lsdb-2', 'vendor_device': 'Cisco', 'igp_protocol': 'ospf',
+         'watcher_name': 'w'},
+    ]
+
+
+def test_upload_many_reports_partial_failures_with_successful_graphs():
+    uploader = Uploader(_Client())
+
+    with pytest.raises(PartialUploadError) as excinfo:
+        uploader.upload_many([
+            {'lsdb_text': 'lsdb-1', 'vendor': 'frr', 'protocol': 'isis'},
+            {'lsdb_text': 'broken', 'vendor': 'frr', 'protocol': 'isis'},
+            {'lsdb_text': 'lsdb-3', 'vendor': 'frr', 'protocol': 'isis'},
+        ])
+
+    error = excinfo.value
+    assert isinstance(error, APIError)
+    assert error.status_code == 500
+    assert str(error) == '1 of 3 uploads failed: Unable to parse LSDB'
+    assert [r.graph_time for r in error.results if not isinstance(r, Exception)] == [
+        'lsdb-1', 'lsdb-3',
+    ]
+    assert error.results[1] is error.errors[0]
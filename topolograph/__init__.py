@@ -7,6 +7,7 @@ from .resources.network import NetworksManager, Network
 from .resources.path import PathsManager, Path
 from .resources.event import EventsManager, Event
 from .collector.collector import TopologyCollector
+from .collector.pool import ConnectionPool
 from .upload.uploader import Uploader
 
 __version__ = "0.1.9"
@@ -24,5 +25,6 @@ __all__ = [
     "EventsManager",
     "Event",
     "TopologyCollector",
+    "ConnectionPool",
     "Uploader",
 ]
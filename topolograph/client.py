@@ -1,9 +1,18 @@
 """Core HTTP client for Topolograph API."""
 
 import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any
 from urllib.parse import urljoin
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install "topolograph-sdk[speedups]"
+    orjson = None
 
 from .exceptions import (
     APIError,
@@ -30,6 +39,9 @@ class Topolograph:
         token: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        keepalive: Optional[float] = None,
+        pool_maxsize: int = 20,
     ):
         """Initialize the Topolograph client.
         
@@ -38,6 +50,15 @@ class Topolograph:
             token: Optional API token for bearer authentication
             username: Optional username for basic authentication
             password: Optional password for basic authentication
+            session: Optional pre-configured requests.Session (custom adapters,
+                retries, proxies, TLS settings). By default a session with a
+                pooled, retrying adapter is created.
+            keepalive: Optional interval in seconds for a background HEAD
+                request that keeps pooled connections warm between calls
+                (useful for long-running watchers). Stop it with close().
+            pool_maxsize: Keep-alive connections per host in the default
+                session (default: 20); raise it for wide concurrent fan-outs
+                such as per-graph status() calls from many threads
         """
         # Ensure URL doesn't end with trailing slash
         self.base_url = url.rstrip('/')
@@ -48,8 +69,26 @@ class Topolograph:
         self.username = username
         self.password = password
         
-        # Create session for connection pooling
-        self.session = requests.Session()
+        # Create session for connection pooling: connections are kept alive
+        # and reused across requests (and threads) instead of re-handshaking
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=pool_maxsize,
+                # Connection failures and gateway errors on idempotent
+                # requests only; the last error response is returned as-is
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=(502, 503, 504),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                ),
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
         
         # Set up authentication
         if self.token:
@@ -67,10 +106,24 @@ class Topolograph:
             'Content-Type': 'application/json',
             'Accept': 'application/json',
         })
+        # requests already asks for gzip/deflate (plus br with the 'speedups'
+        # extra); only fill in a session that was stripped of the header
+        self.session.headers.setdefault('Accept-Encoding', ACCEPT_ENCODING)
         
         # Initialize resource managers
         self._graphs_manager = None
         self._uploader = None
+        
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread = None
+        if keepalive:
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_loop,
+                args=(keepalive,),
+                name='topolograph-keepalive',
+                daemon=True,
+            )
+            self._keepalive_thread.start()
     
     @property
     def graphs(self) -> GraphsManager:
@@ -86,6 +139,29 @@ class Topolograph:
             self._uploader = Uploader(self)
         return self._uploader
     
+    def close(self) -> None:
+        """Stop the keepalive thread (if any) and close pooled connections."""
+        self._keepalive_stop.set()
+        if self._keepalive_thread is not None:
+            self._keepalive_thread.join()
+            self._keepalive_thread = None
+        self.session.close()
+    
+    def __enter__(self) -> 'Topolograph':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _keepalive_loop(self, interval: float) -> None:
+        """Periodically HEAD the base URL so idle pooled connections stay open."""
+        while not self._keepalive_stop.wait(interval):
+            try:
+                self.session.head(self.base_url, timeout=interval)
+            except requests.exceptions.RequestException:
+                # The next real request reconnects through the retrying adapter
+                pass
+    
     def _request(
         self,
         method: str,
@@ -222,3 +298,23 @@ class Topolograph:
             Response object
         """
         return self._request('PATCH', endpoint, **kwargs)
+    
+    def decode(self, response: requests.Response) -> Any:
+        """Decode a JSON response body.
+        
+        Uses orjson when installed (several times faster on large graph,
+        network and path payloads), otherwise `response.json()`.
+        
+        Args:
+            response: Response returned by one of the request methods
+        
+        Returns:
+            Decoded JSON body
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # orjson is strict (e.g. rejects NaN); fall back to the stdlib parser
+                pass
+        return response.json()
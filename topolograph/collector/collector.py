@@ -1,21 +1,40 @@
-"""Nornir-based topology collector."""
+"""Asyncio/scrapli-based topology collector."""
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import io
+import os
+import sys
+from typing import Any, List, Dict, Optional, Sequence, TYPE_CHECKING
 from dataclasses import dataclass
 
-from nornir import InitNornir
-from nornir.core.task import Task, Result
-from nornir_scrapli.tasks import send_command as scrapli_send_command
-try:
-    from nornir_netmiko.tasks import netmiko_send_command
-except ImportError:
-    netmiko_send_command = None
+if TYPE_CHECKING:
+    from scrapli.response import MultiResponse
 
 from .inventory import Inventory, InventoryHost
 from .commands import get_commands
+from .pool import ConnectionPool, PoolKey
 
+# Default ceiling on concurrent SSH sessions; override per collector or via
+# the TOPOLOGRAPH_MAX_CONCURRENCY environment variable
+DEFAULT_MAX_CONCURRENCY = 64
 
-@dataclass
+# Vendor -> scrapli platform; anything not listed uses the generic driver
+_SCRAPLI_PLATFORM_MAP = {
+    'cisco': 'cisco_iosxe',
+    'cisco_nxos': 'cisco_nxos',
+    'juniper': 'juniper_junos',
+    'arista': 'arista_eos',
+    'nokia': 'nokia_sros',
+    'frr': 'generic',  # Use generic for FRR/Quagga
+    'quagga': 'generic',
+    'huawei': 'huawei_vrp',
+}
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class HostResult:
     """Result from a single host collection."""
     hostname: str
@@ -27,7 +46,7 @@ class HostResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CollectionResult:
     """Result from topology collection."""
     raw_lsdb_text: str
@@ -39,25 +58,67 @@ class CollectionResult:
 
 
 class TopologyCollector:
-    """Collects LSDB data from network devices via SSH using Nornir."""
+    """Collects LSDB data from network devices via SSH using asyncio and scrapli."""
     
-    def __init__(self, inventory_path: str):
+    def __init__(
+        self,
+        inventory_path: str,
+        max_concurrency: Optional[int] = None,
+        pool: Optional[ConnectionPool] = None
+    ):
         """Initialize the collector.
         
         Args:
             inventory_path: Path to inventory YAML file
+            max_concurrency: Maximum number of hosts collected from at the same time.
+                Defaults to TOPOLOGRAPH_MAX_CONCURRENCY or 64; each collection
+                uses at most one session per host, so the effective limit is
+                never above the number of hosts being collected.
+            pool: Optional ConnectionPool to keep SSH sessions open between
+                collections awaited on the same event loop via `collect_async`
+                (share one across collectors in long-running apps). The sync
+                `collect()` closes the pool's connections when it returns.
+                Without a pool every collection opens and closes its connections.
         """
         self.inventory = Inventory(inventory_path)
+        self.max_concurrency = max_concurrency
+        self.pool = pool
     
     def collect(self, protocol: Optional[str] = None) -> CollectionResult:
         """Execute topology collection.
         
+        Synchronous wrapper around `collect_async` for callers that are not
+        already running an event loop. Each call runs its own event loop, and
+        async SSH connections cannot outlive it, so connections held by
+        `pool` are closed before the call returns; keep one loop running and
+        await `collect_async` to reuse them across collections.
+        
+        Args:
+            protocol: Optional protocol filter (if None, uses protocol from inventory)
+        
+        Returns:
+            CollectionResult with aggregated LSDB text and per-host results
+        """
+        return asyncio.run(self._collect_and_release(protocol))
+    
+    async def _collect_and_release(self, protocol: Optional[str]) -> CollectionResult:
+        """Run `collect_async`, then close pooled connections opened on this loop."""
+        try:
+            return await self.collect_async(protocol=protocol)
+        finally:
+            if self.pool is not None:
+                await self.pool.close()
+    
+    async def collect_async(self, protocol: Optional[str] = None) -> CollectionResult:
+        """Execute topology collection.
+        
         Collection process:
         1. Read inventory host metadata
         2. Resolve vendor + protocol for each host
-        3. Fetch commands from registry
-        4. Execute commands via Nornir
-        5. Aggregate outputs deterministically
+        3. Fetch commands from registry (hosts without commands fail up front)
+        4. Execute commands over one async SSH connection per host,
+           at most `max_concurrency` hosts at a time
+        5. Aggregate outputs deterministically (inventory order)
         
         Args:
             protocol: Optional protocol filter (if None, uses protocol from inventory)
@@ -75,46 +136,44 @@ class TopologyCollector:
                 errors=["No hosts found in inventory"]
             )
         
-        # Initialize Nornir with custom inventory
-        nornir = self._init_nornir(hosts)
+        # Resolve commands up front: hosts without a registry entry fail here
+        # and never open a connection or take a concurrency slot
+        results: List[Any] = [None] * len(hosts)
+        pending = []
+        for index, host in enumerate(hosts):
+            try:
+                pending.append((index, host, get_commands(host.protocol, host.vendor)))
+            except ValueError as e:
+                results[index] = e
+        
+        semaphore = asyncio.Semaphore(self._concurrency_for(len(pending)))
+        
+        async def collect_bounded(
+            host: InventoryHost,
+            commands: Sequence[str]
+        ) -> "MultiResponse":
+            async with semaphore:
+                return await self._collect_host_async(host, commands)
         
         # Execute collection
-        results = nornir.run(task=self._collect_host)
+        responses = await asyncio.gather(
+            *[collect_bounded(host, commands) for _, host, commands in pending],
+            return_exceptions=True
+        )
+        for (index, _, _), response in zip(pending, responses):
+            results[index] = response
         
         # Process results
         host_results = []
         errors = []
-        aggregated_outputs = []
+        # Outputs are streamed into one buffer (in inventory order) instead of
+        # a list of per-command strings joined at the end
+        aggregated = io.StringIO()
         
-        for host_name, result in results.items():
-            if result.failed:
-                host = next((h for h in hosts if h.name == host_name), None)
-                error_msg = str(result.exception) if result.exception else "Unknown error"
-                errors.append(f"{host_name}: {error_msg}")
-                
-                if host:
-                    host_results.append(HostResult(
-                        hostname=host.hostname,
-                        vendor=host.vendor,
-                        protocol=host.protocol,
-                        commands=[],
-                        outputs={},
-                        success=False,
-                        error=error_msg
-                    ))
-                continue
-            
-            # Extract host info
-            host = next((h for h in hosts if h.name == host_name), None)
-            if not host:
-                errors.append(f"Host {host_name} not found in inventory")
-                continue
-            
-            # Get commands for this host
-            try:
-                commands = get_commands(host.protocol, host.vendor)
-            except ValueError as e:
-                errors.append(f"{host_name}: {e}")
+        for host, result in zip(hosts, results):
+            if isinstance(result, Exception):
+                error_msg = str(result) or type(result).__name__
+                errors.append(f"{host.name}: {error_msg}")
                 host_results.append(HostResult(
                     hostname=host.hostname,
                     vendor=host.vendor,
@@ -122,30 +181,27 @@ class TopologyCollector:
                     commands=[],
                     outputs={},
                     success=False,
-                    error=str(e)
+                    error=error_msg
                 ))
                 continue
             
             # Process command outputs
             outputs = {}
-            host_outputs = []
+            commands = []
             
-            if isinstance(result.result, dict):
-                # Multiple commands executed
-                for cmd, cmd_result in result.result.items():
-                    if cmd_result.failed:
-                        outputs[cmd] = f"ERROR: {cmd_result.exception}"
-                        errors.append(f"{host_name} - {cmd}: {cmd_result.exception}")
-                    else:
-                        output = cmd_result.result if hasattr(cmd_result, 'result') else str(cmd_result)
-                        outputs[cmd] = output
-                        host_outputs.append(f"=== {host_name} - {cmd} ===\n{output}\n")
-            else:
-                # Single command
-                output = result.result if hasattr(result, 'result') else str(result)
-                if commands:
-                    outputs[commands[0]] = output
-                    host_outputs.append(f"=== {host_name} - {commands[0]} ===\n{output}\n")
+            for response in result:
+                cmd = response.channel_input
+                commands.append(cmd)
+                if response.failed:
+                    outputs[cmd] = f"ERROR: {response.result}"
+                    errors.append(f"{host.name} - {cmd}: {response.result}")
+                else:
+                    outputs[cmd] = response.result
+                    if aggregated.tell():
+                        aggregated.write("\n")
+                    aggregated.write(f"=== {host.name} - {cmd} ===\n")
+                    aggregated.write(response.result)
+                    aggregated.write("\n")
             
             host_results.append(HostResult(
                 hostname=host.hostname,
@@ -155,136 +211,105 @@ class TopologyCollector:
                 outputs=outputs,
                 success=True
             ))
-            
-            # Aggregate outputs (deterministic order by hostname)
-            aggregated_outputs.extend(host_outputs)
-        
-        # Combine all outputs
-        raw_lsdb_text = "\n".join(aggregated_outputs)
         
         return CollectionResult(
-            raw_lsdb_text=raw_lsdb_text,
+            raw_lsdb_text=aggregated.getvalue(),
             host_results=host_results,
             errors=errors
         )
     
-    def _init_nornir(self, hosts: List[InventoryHost]) -> InitNornir:
-        """Initialize Nornir with custom inventory from hosts.
+    def _concurrency_for(self, host_count: int) -> int:
+        """Number of hosts to collect from at once for a collection of `host_count`.
         
-        Args:
-            hosts: List of inventory hosts
-        
-        Returns:
-            Initialized Nornir instance
+        Raises:
+            ValueError: If TOPOLOGRAPH_MAX_CONCURRENCY is set to a non-integer
         """
-        import tempfile
-        import yaml
-        from pathlib import Path
-        
-        # Create temporary inventory files
-        temp_dir = Path(tempfile.mkdtemp())
-        hosts_file = temp_dir / "hosts.yaml"
-        groups_file = temp_dir / "groups.yaml"
-        defaults_file = temp_dir / "defaults.yaml"
-        
-        # Build hosts dictionary
-        hosts_dict = {}
-        for host in hosts:
-            hosts_dict[host.name] = {
-                'hostname': host.hostname,
-                'port': host.port,
-                'username': host.username,
-                'password': host.password,
-                'platform': self._get_nornir_platform(host.vendor),
-                'data': {
-                    'vendor': host.vendor,
-                    'protocol': host.protocol
-                }
-            }
-        
-        # Write inventory files
-        with open(hosts_file, 'w') as f:
-            yaml.dump(hosts_dict, f)
-        
-        with open(groups_file, 'w') as f:
-            yaml.dump({}, f)
-        
-        with open(defaults_file, 'w') as f:
-            yaml.dump({}, f)
-        
-        # Initialize Nornir with SimpleInventory plugin
-        nornir = InitNornir(
-            inventory={
-                'plugin': 'SimpleInventory',
-                'options': {
-                    'host_file': str(hosts_file),
-                    'group_file': str(groups_file),
-                    'defaults_file': str(defaults_file)
-                }
-            },
-            runner={
-                'plugin': 'threaded',
-                'options': {
-                    'num_workers': 10
-                }
-            }
-        )
-        
-        return nornir
+        limit = self.max_concurrency
+        if limit is None:
+            value = os.environ.get('TOPOLOGRAPH_MAX_CONCURRENCY', '').strip()
+            try:
+                limit = int(value) if value else DEFAULT_MAX_CONCURRENCY
+            except ValueError:
+                raise ValueError(
+                    f"TOPOLOGRAPH_MAX_CONCURRENCY must be an integer, got {value!r}"
+                ) from None
+        return max(1, min(host_count, limit))
     
-    def _get_nornir_platform(self, vendor: str) -> str:
-        """Map vendor to Nornir platform name.
+    def _build_driver(self, host: InventoryHost):
+        """Build an (unopened) async scrapli driver for a host.
+        
+        Driver options are built in memory from the inventory host; nothing
+        (credentials included) is written to disk. The host's
+        `connection_options` are passed through as extra scrapli arguments
+        (e.g. auth_strict_key, timeout_ops) and override the defaults.
         
         Args:
-            vendor: Vendor name
+            host: Inventory host
         
         Returns:
-            Nornir platform name
+            AsyncScrapli driver for known platforms, AsyncGenericDriver otherwise
         """
-        platform_map = {
-            'cisco': 'ios',
-            'juniper': 'junos',
-            'arista': 'eos',
-            'nokia': 'sros',
-            'frr': 'generic',  # Use generic for FRR/Quagga
-            'quagga': 'generic',
-            'huawei': 'huawei'
+        # Imported here so that importing the SDK does not pull in scrapli and
+        # its transport stack unless a collection actually runs
+        from scrapli import AsyncScrapli
+        from scrapli.driver import AsyncGenericDriver
+        
+        options = {
+            'host': host.hostname,
+            'port': host.port,
+            'auth_username': host.username,
+            'auth_password': host.password,
+            'transport': 'asyncssh',
+            **host.connection_options,
         }
-        return platform_map.get(vendor.lower(), 'generic')
+        platform = self._get_scrapli_platform(host.vendor)
+        if platform == 'generic':
+            # FRR/Quagga and unknown vendors: plain prompt-driven shell
+            return AsyncGenericDriver(**options)
+        return AsyncScrapli(platform=platform, **options)
     
-    def _collect_host(self, task: Task) -> Result:
-        """Task to collect LSDB from a single host.
+    def _pool_key(self, host: InventoryHost) -> PoolKey:
+        """Connection pool key for a host."""
+        return (host.hostname, host.port, host.username, self._get_scrapli_platform(host.vendor))
+    
+    @staticmethod
+    def _get_scrapli_platform(vendor: str) -> str:
+        """Map vendor to scrapli platform name.
         
         Args:
-            task: Nornir task
+            vendor: Vendor name (InventoryHost.vendor is already lowercase)
         
         Returns:
-            Result with command outputs
+            Scrapli core or community platform name, or 'generic'
         """
-        host = task.host
-        vendor = host.data.get('vendor', '')
-        protocol = host.data.get('protocol', '')
+        platform = _SCRAPLI_PLATFORM_MAP.get(vendor)
+        if platform is None:
+            platform = _SCRAPLI_PLATFORM_MAP.get(vendor.lower(), 'generic')
+        return platform
+    
+    async def _collect_host_async(
+        self,
+        host: InventoryHost,
+        commands: Sequence[str]
+    ) -> "MultiResponse":
+        """Collect LSDB from a single host.
         
-        # Get commands for this host
-        try:
-            commands = get_commands(protocol, vendor)
-        except ValueError as e:
-            return Result(host=host, failed=True, exception=ValueError(str(e)))
+        All commands are sent in one batched `send_commands` call, so the
+        channel is synchronized once per host rather than once per command.
         
-        # Execute commands - use netmiko for generic platforms, scrapli for others
-        results = {}
-        platform = host.platform or 'generic'
+        Args:
+            host: Inventory host
+            commands: Commands resolved from the registry for this host
         
-        for cmd in commands:
-            try:
-                if platform == 'generic' and netmiko_send_command:
-                    # Use netmiko for generic platforms (FRR, Quagga, etc.)
-                    result = netmiko_send_command(task=task, command_string=cmd)
-                else:
-                    # Use scrapli for specific platforms
-                    result = scrapli_send_command(task=task, command=cmd)
-                results[cmd] = result
-            except Exception as e:
-                results[cmd] = Result(host=host, failed=True, exception=e)
+        Returns:
+            scrapli MultiResponse with one Response per command, in order
+        """
+        if self.pool is not None:
+            connection = self.pool.connection(
+                self._pool_key(host), lambda: self._build_driver(host)
+            )
+        else:
+            connection = self._build_driver(host)
         
-        return Result(host=host, result=results)
+        async with connection as conn:
+            return await conn.send_commands(commands)
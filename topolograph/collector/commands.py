@@ -1,5 +1,8 @@
 """Command registry for vendor and protocol-specific LSDB collection commands."""
 
+import sys
+from typing import Tuple
+
 COMMAND_REGISTRY = {
     "ospf": {
         "cisco": [
@@ -113,7 +116,18 @@ COMMAND_REGISTRY = {
 }
 
 
-def get_commands(protocol: str, vendor: str) -> list:
+# Flattened, lowercased view of COMMAND_REGISTRY built once at import. Command
+# lists are stored as tuples so get_commands can hand them out without copying;
+# names are interned to match the interned InventoryHost.vendor/protocol.
+_REGISTRY = {
+    (sys.intern(protocol.lower()), sys.intern(vendor.lower())): tuple(commands)
+    for protocol, vendors in COMMAND_REGISTRY.items()
+    for vendor, commands in vendors.items()
+}
+_PROTOCOLS = frozenset(protocol for protocol, _ in _REGISTRY)
+
+
+def get_commands(protocol: str, vendor: str) -> Tuple[str, ...]:
     """Get commands for a specific protocol and vendor.
     
     Args:
@@ -121,7 +135,7 @@ def get_commands(protocol: str, vendor: str) -> list:
         vendor: Vendor name (cisco, juniper, frr, etc.)
     
     Returns:
-        List of commands to execute
+        Tuple of commands to execute (shared and immutable, no copy is made)
     
     Raises:
         ValueError: If protocol or vendor not found in registry
@@ -129,16 +143,17 @@ def get_commands(protocol: str, vendor: str) -> list:
     protocol = protocol.lower()
     vendor = vendor.lower()
     
-    if protocol not in COMMAND_REGISTRY:
-        raise ValueError(f"Protocol '{protocol}' not found in command registry")
+    commands = _REGISTRY.get((protocol, vendor))
+    if commands is not None:
+        return commands
     
-    if vendor not in COMMAND_REGISTRY[protocol]:
-        raise ValueError(
-            f"Vendor '{vendor}' not found for protocol '{protocol}'. "
-            f"Available vendors: {list(COMMAND_REGISTRY[protocol].keys())}"
-        )
+    if protocol not in _PROTOCOLS:
+        raise ValueError(f"Protocol '{protocol}' not found in command registry")
     
-    return COMMAND_REGISTRY[protocol][vendor].copy()
+    raise ValueError(
+        f"Vendor '{vendor}' not found for protocol '{protocol}'. "
+        f"Available vendors: {list(COMMAND_REGISTRY[protocol].keys())}"
+    )
 
 
 def list_protocols() -> list:
@@ -163,7 +178,7 @@ def list_vendors(protocol: str) -> list:
         ValueError: If protocol not found
     """
     protocol = protocol.lower()
-    if protocol not in COMMAND_REGISTRY:
+    if protocol not in _PROTOCOLS:
         raise ValueError(f"Protocol '{protocol}' not found in command registry")
     
     return list(COMMAND_REGISTRY[protocol].keys())
@@ -1,13 +1,31 @@
 """Inventory handling for topology collection."""
 
+import json
+import os
+import sys
+import tempfile
 import yaml
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+# Bump whenever parsing or normalisation changes so stale sidecars are re-parsed
+_CACHE_FORMAT = 1
+
+try:
+    # LibYAML-backed loader, several times faster on large inventories
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class InventoryHost:
     """Represents a single host in the inventory."""
     
+    __slots__ = (
+        'name', 'hostname', 'username', 'password', 'vendor', 'protocol', 'port',
+        'connection_options',
+    )
+    
     def __init__(self, name: str, data: Dict[str, Any]):
         """Initialize an InventoryHost.
         
@@ -19,12 +37,13 @@ class InventoryHost:
         self.hostname = data.get('hostname') or data.get('host')
         self.username = data.get('username') or data.get('user')
         self.password = data.get('password')
-        self.vendor = data.get('vendor', '').lower()
-        self.protocol = data.get('protocol', '').lower()
+        # Interned: a handful of distinct values shared by every host
+        self.vendor = sys.intern(data.get('vendor', '').lower())
+        self.protocol = sys.intern(data.get('protocol', '').lower())
         self.port = data.get('port', 22)
         
         # Additional connection parameters
-        self.connection_options = data.get('connection_options', {})
+        self.connection_options = data.get('connection_options') or {}
         
         # Validate required fields
         if not self.hostname:
@@ -52,15 +71,22 @@ class Inventory:
             ValueError: If inventory format is invalid
         """
         self.path = Path(inventory_path)
+        self.cache_path = self.path.with_suffix(self.path.suffix + '.cache.json')
         
         if not self.path.exists():
             raise FileNotFoundError(f"Inventory file not found: {inventory_path}")
         
-        with open(self.path, 'r') as f:
-            try:
-                data = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                raise ValueError(f"Invalid YAML in inventory file: {e}")
+        stat = self.path.stat()
+        data = self._read_cache(stat)
+        if data is None:
+            with open(self.path, 'rb') as f:
+                try:
+                    data = yaml.load(f, Loader=_SafeLoader)
+                except yaml.YAMLError as e:
+                    raise ValueError(f"Invalid YAML in inventory file: {e}")
+            if data is None:
+                data = {}  # Empty file: a valid inventory with no hosts
+            self._write_cache(stat, data)
         
         if not isinstance(data, dict):
             raise ValueError("Inventory must be a dictionary")
@@ -73,10 +99,82 @@ class Inventory:
                 self.hosts.append(InventoryHost(name, host_data))
             except ValueError as e:
                 raise ValueError(f"Error parsing host '{name}': {e}")
+        
+        # Filter indexes for get_hosts(), built once in inventory order
+        self._by_protocol: Dict[str, List[InventoryHost]] = {}
+        self._by_vendor: Dict[str, List[InventoryHost]] = {}
+        self._by_protocol_vendor: Dict[Tuple[str, str], List[InventoryHost]] = {}
+        for host in self.hosts:
+            self._by_protocol.setdefault(host.protocol, []).append(host)
+            self._by_vendor.setdefault(host.vendor, []).append(host)
+            self._by_protocol_vendor.setdefault((host.protocol, host.vendor), []).append(host)
+    
+    def _read_cache(self, stat: os.stat_result) -> Optional[Any]:
+        """Load the parsed inventory from the JSON sidecar if it is still fresh.
+        
+        The cache is keyed by the cache format version and the source file's
+        mtime and size; any mismatch or read error falls back to parsing the YAML.
+        
+        Args:
+            stat: Stat result of the inventory file
+        
+        Returns:
+            Cached inventory data, or None if there is no usable cache
+        """
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if (not isinstance(cache, dict)
+                or cache.get('format') != _CACHE_FORMAT
+                or cache.get('mtime_ns') != stat.st_mtime_ns
+                or cache.get('size') != stat.st_size):
+            return None
+        return cache.get('data')
+    
+    def _write_cache(self, stat: os.stat_result, data: Any) -> None:
+        """Store the parsed inventory in the JSON sidecar (best effort).
+        
+        Written atomically via a temporary file so concurrent readers never see
+        a partial cache. The sidecar holds the same credentials as the
+        inventory, so the temporary file is created exclusively under a random
+        name and is readable by its owner only (0600) from the start.
+        
+        Args:
+            stat: Stat result of the inventory file the data was parsed from
+            data: Parsed inventory data
+        """
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=f"{self.cache_path.name}.", suffix='.tmp', dir=self.cache_path.parent
+            )
+        except OSError:
+            return  # Read-only directory
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({
+                    'format': _CACHE_FORMAT,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'data': data,
+                }, f)
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError, ValueError):
+            # YAML values JSON cannot represent, or the write failed
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
     
     def get_hosts(self, protocol: str = None, vendor: str = None) -> List[InventoryHost]:
         """Get hosts filtered by protocol and/or vendor.
         
+        Lookups are served from indexes built at load time. The returned list
+        is shared with the inventory and must not be modified; copy it first
+        if needed.
+        
         Args:
             protocol: Optional protocol filter
             vendor: Optional vendor filter
@@ -84,20 +182,19 @@ class Inventory:
         Returns:
             List of matching InventoryHost objects
         """
-        hosts = self.hosts
-        
+        if protocol and vendor:
+            return self._by_protocol_vendor.get((protocol.lower(), vendor.lower()), [])
         if protocol:
-            protocol = protocol.lower()
-            hosts = [h for h in hosts if h.protocol == protocol]
-        
+            return self._by_protocol.get(protocol.lower(), [])
         if vendor:
-            vendor = vendor.lower()
-            hosts = [h for h in hosts if h.vendor == vendor]
-        
-        return hosts
+            return self._by_vendor.get(vendor.lower(), [])
+        return self.hosts
     
     def __len__(self) -> int:
         return len(self.hosts)
     
+    def __bool__(self) -> bool:
+        return bool(self.hosts)
+    
     def __iter__(self):
         return iter(self.hosts)
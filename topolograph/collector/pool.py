@@ -0,0 +1,132 @@
+"""Persistent SSH connection pool for topology collection."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
+
+PoolKey = Tuple[str, int, str, str]
+
+
+class _PooledConnection:
+    """An open driver plus the bookkeeping needed to expire it."""
+
+    def __init__(self, driver: Any, loop: asyncio.AbstractEventLoop):
+        self.driver = driver
+        self.loop = loop
+        self.opened_at = time.monotonic()
+        self.last_used = self.opened_at
+
+
+class ConnectionPool:
+    """Keeps authenticated async scrapli connections open between collections.
+
+    Connections are keyed by (hostname, port, username, platform) and checked
+    out for exclusive use, so concurrent collections never share a channel.
+    Idle connections are closed once unused for `idle_timeout` seconds or older
+    than `max_age` seconds. There is no background reaper: expiry is only
+    checked when the pool is used again, so call `close()` when a pool will
+    sit unused.
+
+    Async SSH connections belong to the event loop that opened them, so a pool
+    only pays off for callers that keep one loop running (e.g. a watcher
+    awaiting `TopologyCollector.collect_async`). `TopologyCollector.collect`
+    runs a fresh loop per call and closes the pool before that loop ends.
+    Connections left behind by a loop that has since finished cannot be
+    closed from another loop; they are dropped rather than reused, so callers
+    running their own loops should `await pool.close()` before each loop ends.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, max_age: float = 3600.0):
+        """Initialize the pool.
+
+        Args:
+            idle_timeout: Seconds an unused connection is kept open (default: 300),
+                enforced on the pool's next use
+            max_age: Seconds after which a connection is closed regardless of use
+                (default: 3600), enforced on the pool's next use
+        """
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self._idle: Dict[PoolKey, List[_PooledConnection]] = {}
+
+    @asynccontextmanager
+    async def connection(self, key: PoolKey, factory: Callable[[], Any]) -> AsyncIterator[Any]:
+        """Check out an open driver for `key`, opening one with `factory` if needed.
+
+        The driver is returned to the pool on success and closed if the body
+        raises, since its channel state is then unknown.
+
+        Args:
+            key: (hostname, port, username, platform) tuple
+            factory: Callable returning a new, unopened async scrapli driver
+        """
+        pooled = await self._acquire(key, factory)
+        try:
+            yield pooled.driver
+        except BaseException:
+            await self._close(pooled)
+            raise
+        pooled.last_used = time.monotonic()
+        self._idle.setdefault(key, []).append(pooled)
+
+    async def close(self) -> None:
+        """Close every idle connection in the pool."""
+        entries = [pooled for idle in self._idle.values() for pooled in idle]
+        self._idle.clear()
+        for pooled in entries:
+            await self._close(pooled)
+
+    def __len__(self) -> int:
+        return sum(len(idle) for idle in self._idle.values())
+
+    async def _acquire(self, key: PoolKey, factory: Callable[[], Any]) -> _PooledConnection:
+        await self._reap()
+        # Re-read the idle list on every pass: other coroutines may check out
+        # or reap connections while this one awaits a close
+        while True:
+            idle = self._idle.get(key)
+            if not idle:
+                break
+            pooled = idle.pop()
+            if not idle:
+                del self._idle[key]
+            if pooled.driver.isalive():
+                return pooled
+            await self._close(pooled)
+
+        driver = factory()
+        await driver.open()
+        return _PooledConnection(driver, asyncio.get_running_loop())
+
+    async def _reap(self) -> None:
+        """Close idle connections that expired; drop those of other event loops.
+
+        The idle lists are rebuilt without awaiting, so concurrent checkouts
+        never see a connection that is being closed or already handed out.
+        """
+        now = time.monotonic()
+        loop = asyncio.get_running_loop()
+        expired = []
+        for key in list(self._idle):
+            keep = []
+            for pooled in self._idle[key]:
+                if pooled.loop is not loop:
+                    continue  # Its loop is gone; the transport cannot be closed from here
+                if (now - pooled.last_used > self.idle_timeout
+                        or now - pooled.opened_at > self.max_age):
+                    expired.append(pooled)
+                else:
+                    keep.append(pooled)
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+        for pooled in expired:
+            await self._close(pooled)
+
+    async def _close(self, pooled: _PooledConnection) -> None:
+        try:
+            await pooled.driver.close()
+        except Exception:
+            pass
@@ -27,3 +27,22 @@ class NotFoundError(APIError):
 class ValidationError(APIError):
     """Raised when request validation fails (400/405)."""
     pass
+
+
+class PartialUploadError(APIError):
+    """Raised when some uploads of a batch fail.
+    
+    `results` has one entry per item, in order: the uploaded Graph, or the
+    exception that upload raised. Status code and response are taken from
+    the first failure.
+    """
+    def __init__(self, message, results):
+        errors = [r for r in results if isinstance(r, Exception)]
+        first = errors[0] if errors else None
+        super().__init__(
+            message,
+            status_code=getattr(first, 'status_code', None),
+            response=getattr(first, 'response', None),
+        )
+        self.results = results
+        self.errors = errors
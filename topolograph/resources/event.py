@@ -1,12 +1,60 @@
 """Event resource for Topolograph API."""
 
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from datetime import datetime
 
+import requests
+import urllib3
+
+from ..exceptions import APIError
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+NETWORK_EVENT_KEYS = ('network_up_down_events', 'network_cost_change_events')
+ADJACENCY_EVENT_KEYS = (
+    'all_host_up_down_events',
+    'single_host_up_events',
+    'single_host_down_events',
+    'adjacency_cost_change_events',
+)
+
+
+def _parse_event_items(stream, keys: Tuple[str, ...]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Incrementally parse {key: [event, ...]} JSON, yielding (key, event dict)."""
+    item_prefixes = {f'{key}.item': key for key in keys}
+    builder = None
+    key = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is None:
+            if event == 'start_map' and prefix in item_prefixes:
+                key = item_prefixes[prefix]
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            continue
+        builder.event(event, value)
+        if event == 'end_map' and prefix in item_prefixes:
+            yield key, builder.value
+            builder = None
+
 
 class Event:
     """Represents a topology event."""
     
+    __slots__ = (
+        'event_detected_by', 'graph_time', 'timestamp', 'watcher_time',
+        'event_status', 'watcher_name', 'level_number', 'event_name',
+        'event_object', 'area_num', 'asn', 'new_cost', 'old_cost', 'protocol',
+        'local_ip_address', 'object_status', 'subnet_type', 'int_ext_subtype',
+        'attributes',
+    )
+    # API keys mapped to their own attribute; any other key lands in `attributes`
+    _KNOWN_KEYS = frozenset(__slots__) - {'attributes'}
+    
     def __init__(self, data: Dict[str, Any]):
         """Initialize an Event object.
         
@@ -33,7 +81,7 @@ class Event:
         self.subnet_type = data.get('subnet_type')
         self.int_ext_subtype = data.get('int_ext_subtype')
         # Additional attributes
-        self.attributes = {k: v for k, v in data.items() if not hasattr(self, k)}
+        self.attributes = {k: v for k, v in data.items() if k not in Event._KNOWN_KEYS}
     
     def __repr__(self) -> str:
         return f"Event(name={self.event_name}, status={self.event_status}, object={self.event_object})"
@@ -51,6 +99,7 @@ class EventsManager:
         """
         self._client = client
         self.graph_time = graph_time
+        self._url = f'/events/{graph_time}'
     
     def get_network_events(
         self,
@@ -70,36 +119,9 @@ class EventsManager:
             - network_up_down_events: List of network up/down events
             - network_cost_change_events: List of network cost change events
         """
-        params = {}
-        if last_minutes:
-            params['last_minutes'] = last_minutes
-        else:
-            if start_time:
-                params['start_time'] = start_time
-            if end_time:
-                params['end_time'] = end_time
-        
-        response = self._client.get(
-            f'/events/{self.graph_time}/networks',
-            params=params
-        )
-        events_data = response.json()
-        
-        result = {
-            'network_up_down_events': [],
-            'network_cost_change_events': []
-        }
-        
-        if 'network_up_down_events' in events_data:
-            result['network_up_down_events'] = [
-                Event(e) for e in events_data['network_up_down_events']
-            ]
-        
-        if 'network_cost_change_events' in events_data:
-            result['network_cost_change_events'] = [
-                Event(e) for e in events_data['network_cost_change_events']
-            ]
-        
+        result: Dict[str, List[Event]] = {key: [] for key in NETWORK_EVENT_KEYS}
+        for key, event in self.iter_network_events(start_time, end_time, last_minutes):
+            result[key].append(event)
         return result
     
     def get_adjacency_events(
@@ -122,6 +144,71 @@ class EventsManager:
             - single_host_down_events: List of host down events
             - adjacency_cost_change_events: List of link cost change events
         """
+        result: Dict[str, List[Event]] = {key: [] for key in ADJACENCY_EVENT_KEYS}
+        for key, event in self.iter_adjacency_events(start_time, end_time, last_minutes):
+            result[key].append(event)
+        return result
+    
+    def iter_network_events(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        last_minutes: Optional[int] = None
+    ) -> Iterator[Tuple[str, Event]]:
+        """Iterate over network events without materializing the whole response.
+        
+        Same query as get_network_events. With the optional `ijson` package
+        installed the response body is parsed incrementally, so only one event
+        is held in memory at a time.
+        
+        Args:
+            start_time: Start time in ISO format (e.g., "2025-06-30T20:00:00Z")
+            end_time: End time in ISO format
+            last_minutes: Number of minutes to look back (overrides start_time/end_time)
+        
+        Yields:
+            (key, Event) tuples, key being network_up_down_events or
+            network_cost_change_events
+        """
+        return self._iter_events(
+            f'{self._url}/networks',
+            NETWORK_EVENT_KEYS,
+            start_time, end_time, last_minutes
+        )
+    
+    def iter_adjacency_events(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        last_minutes: Optional[int] = None
+    ) -> Iterator[Tuple[str, Event]]:
+        """Iterate over adjacency events without materializing the whole response.
+        
+        Same query as get_adjacency_events; see iter_network_events.
+        
+        Args:
+            start_time: Start time in ISO format (e.g., "2025-06-30T20:00:00Z")
+            end_time: End time in ISO format
+            last_minutes: Number of minutes to look back (overrides start_time/end_time)
+        
+        Yields:
+            (key, Event) tuples, key being one of the get_adjacency_events keys
+        """
+        return self._iter_events(
+            f'{self._url}/adjacency',
+            ADJACENCY_EVENT_KEYS,
+            start_time, end_time, last_minutes
+        )
+    
+    def _iter_events(
+        self,
+        endpoint: str,
+        keys: Tuple[str, ...],
+        start_time: Optional[str],
+        end_time: Optional[str],
+        last_minutes: Optional[int]
+    ) -> Iterator[Tuple[str, Event]]:
+        """Stream (key, Event) pairs for the event lists under `keys` of an endpoint."""
         params = {}
         if last_minutes:
             params['last_minutes'] = last_minutes
@@ -131,39 +218,50 @@ class EventsManager:
             if end_time:
                 params['end_time'] = end_time
         
-        response = self._client.get(
-            f'/events/{self.graph_time}/adjacency',
-            params=params
-        )
-        events_data = response.json()
-        
-        result = {
-            'all_host_up_down_events': [],
-            'single_host_up_events': [],
-            'single_host_down_events': [],
-            'adjacency_cost_change_events': []
-        }
-        
-        if 'all_host_up_down_events' in events_data:
-            result['all_host_up_down_events'] = [
-                Event(e) for e in events_data['all_host_up_down_events']
-            ]
-        
-        if 'single_host_up_events' in events_data:
-            result['single_host_up_events'] = [
-                Event(e) for e in events_data['single_host_up_events']
-            ]
-        
-        if 'single_host_down_events' in events_data:
-            result['single_host_down_events'] = [
-                Event(e) for e in events_data['single_host_down_events']
-            ]
-        
-        if 'adjacency_cost_change_events' in events_data:
-            result['adjacency_cost_change_events'] = [
-                Event(e) for e in events_data['adjacency_cost_change_events']
-            ]
-
+        response = self._client.get(endpoint, params=params, stream=True)
+        try:
+            if ijson is None:
+                events_data = self._client.decode(response)
+                for key in keys:
+                    for item in events_data.get(key) or ():
+                        yield key, Event(item)
+            else:
+                response.raw.decode_content = True
+                for key, item in _parse_event_items(response.raw, keys):
+                    yield key, Event(item)
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            # The body is read after _request returned, so surface read
+            # failures (resets, timeouts) the same way it does
+            raise APIError(f"Request failed: {str(e)}")
+        finally:
+            response.close()
+    
+    def get_all_events(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        last_minutes: Optional[int] = None
+    ) -> Dict[str, List[Event]]:
+        """Get network and adjacency events in one call.
+        
+        Both endpoints are queried concurrently, so the wall-clock cost is one
+        round-trip rather than two back to back.
+        
+        Args:
+            start_time: Start time in ISO format (e.g., "2025-06-30T20:00:00Z")
+            end_time: End time in ISO format
+            last_minutes: Number of minutes to look back (overrides start_time/end_time)
+        
+        Returns:
+            Dictionary with the keys of both get_network_events and
+            get_adjacency_events
+        """
+        kwargs = {'start_time': start_time, 'end_time': end_time, 'last_minutes': last_minutes}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            network_future = executor.submit(self.get_network_events, **kwargs)
+            adjacency_future = executor.submit(self.get_adjacency_events, **kwargs)
+            result = network_future.result()
+            result.update(adjacency_future.result())
         return result
 
     def get_events_timeline(
@@ -210,7 +308,7 @@ class EventsManager:
                 params['end_time'] = end_time
 
         response = self._client.get(
-            f'/events/{self.graph_time}/adjacency/timeline',
+            f'{self._url}/adjacency/timeline',
             params=params
         )
-        return response.json()
+        return self._client.decode(response)
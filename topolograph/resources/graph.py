@@ -1,6 +1,9 @@
 """Graph resource for Topolograph API."""
 
-from typing import Optional, List, Dict, Any, Union
+import time
+from collections import OrderedDict
+from functools import cached_property
+from typing import Optional, List, Dict, Any, Tuple, Union
 from .node import NodesManager
 from .network import NetworksManager
 from .path import PathsManager
@@ -18,50 +21,50 @@ class Graph:
             data: Graph data from API
         """
         self._client = client
+        self._raw = data
         self.graph_time = data.get('graph_time')
+        self._url = f'/graph/{self.graph_time}'
         self.timestamp = data.get('timestamp')
         self.protocol = data.get('protocol')
         self.watcher_name = data.get('watcher_name')
         self.is_from_watcher = data.get('is_from_watcher', False)
         self.is_monitored = data.get('is_monitored', self.is_from_watcher)
         self.is_live = data.get('is_live', False)
-        self.hosts = data.get('hosts', {})
-        self.networks_data = data.get('networks', {})
-        self.areas = data.get('areas', [])
-        
-        # Initialize resource managers
-        self._nodes_manager = None
-        self._networks_manager = None
-        self._paths_manager = None
-        self._events_manager = None
     
-    @property
+    @cached_property
+    def hosts(self) -> Dict[str, Any]:
+        """Host summary of this graph (e.g. {'count': 3})."""
+        return self._raw.get('hosts', {})
+    
+    @cached_property
+    def networks_data(self) -> Dict[str, Any]:
+        """Network summary of this graph (e.g. {'count': 12})."""
+        return self._raw.get('networks', {})
+    
+    @cached_property
+    def areas(self) -> List[Any]:
+        """Areas present in this graph."""
+        return self._raw.get('areas', [])
+    
+    @cached_property
     def nodes(self) -> NodesManager:
         """Get nodes manager for this graph."""
-        if self._nodes_manager is None:
-            self._nodes_manager = NodesManager(self._client, self.graph_time)
-        return self._nodes_manager
+        return NodesManager(self._client, self.graph_time)
     
-    @property
+    @cached_property
     def networks(self) -> NetworksManager:
         """Get networks manager for this graph."""
-        if self._networks_manager is None:
-            self._networks_manager = NetworksManager(self._client, self.graph_time)
-        return self._networks_manager
+        return NetworksManager(self._client, self.graph_time)
     
-    @property
+    @cached_property
     def paths(self) -> PathsManager:
         """Get paths manager for this graph."""
-        if self._paths_manager is None:
-            self._paths_manager = PathsManager(self._client, self.graph_time)
-        return self._paths_manager
+        return PathsManager(self._client, self.graph_time)
     
-    @property
+    @cached_property
     def events(self) -> EventsManager:
         """Get events manager for this graph."""
-        if self._events_manager is None:
-            self._events_manager = EventsManager(self._client, self.graph_time)
-        return self._events_manager
+        return EventsManager(self._client, self.graph_time)
     
     def status(self) -> Dict[str, Any]:
         """Get the status of this graph.
@@ -72,8 +75,8 @@ class Graph:
             - details: is_monitored, is_connected, event counts, and
               top_unstable_devices (top-N {device, event_count} sorted desc)
         """
-        response = self._client.get(f'/graph/{self.graph_time}/status')
-        return response.json()
+        response = self._client.get(f'{self._url}/status')
+        return self._client.decode(response)
     
     def networks_list(
         self,
@@ -98,8 +101,8 @@ class Graph:
             'per_page': per_page,
             'filter_type': filter_type
         }
-        response = self._client.get(f'/graph/{self.graph_time}/networks', params=params)
-        return response.json()
+        response = self._client.get(f'{self._url}/networks', params=params)
+        return self._client.decode(response)
     
     def nodes_list(
         self,
@@ -145,8 +148,8 @@ class Graph:
         for flag_name, flag_value in (('abr', abr), ('asbr', asbr), ('overload', overload), ('attached', attached), ('maxmetric', maxmetric)):
             if flag_value is not None:
                 params[flag_name] = int(flag_value)
-        response = self._client.get(f'/graph/{self.graph_time}/nodes', params=params)
-        return response.json()
+        response = self._client.get(f'{self._url}/nodes', params=params)
+        return self._client.decode(response)
     
     def areas_list(self) -> Dict[str, Any]:
         """Get list of areas (no pagination needed, typically < 20 areas).
@@ -160,8 +163,8 @@ class Graph:
             - items: List of area dicts with area_id, nodes_count, networks_count,
                      and is_backbone (OSPF only)
         """
-        response = self._client.get(f'/graph/{self.graph_time}/areas')
-        return response.json()
+        response = self._client.get(f'{self._url}/areas')
+        return self._client.decode(response)
     
     def edges_list(
         self,
@@ -220,8 +223,8 @@ class Graph:
         if include:
             params['include'] = ','.join(include)
         params.update(edge_query_params)
-        response = self._client.get(f'/graph/{self.graph_time}/edges', params=params)
-        return response.json()
+        response = self._client.get(f'{self._url}/edges', params=params)
+        return self._client.decode(response)
 
     def lsps_list(
         self,
@@ -268,27 +271,27 @@ class Graph:
         if include_path:
             params['include'] = 'path'
         kwargs = {'params': params} if params else {}
-        return self._client.get(f'/graph/{self.graph_time}/lsps', **kwargs).json()
+        return self._client.decode(self._client.get(f'{self._url}/lsps', **kwargs))
 
     def lsp(self, name: str) -> Dict[str, Any]:
         """Get one MPLS TE LSP tunnel by name (always includes each path's expanded path)."""
-        return self._client.get(f'/graph/{self.graph_time}/lsps/{name}').json()
+        return self._client.decode(self._client.get(f'{self._url}/lsps/{name}'))
 
     def add_lsp(self, lsp: Dict[str, Any]) -> Dict[str, Any]:
         """Add an MPLS TE LSP tunnel."""
-        return self._client.post(f'/graph/{self.graph_time}/lsps', json=lsp).json()
+        return self._client.decode(self._client.post(f'{self._url}/lsps', json=lsp))
 
     def update_lsp(self, name: str, **changes: Any) -> Dict[str, Any]:
         """Update or rename an MPLS TE LSP tunnel."""
-        return self._client.patch(f'/graph/{self.graph_time}/lsps/{name}', json=changes).json()
+        return self._client.decode(self._client.patch(f'{self._url}/lsps/{name}', json=changes))
 
     def delete_lsp(self, name: str) -> Dict[str, Any]:
         """Delete one MPLS TE LSP tunnel."""
-        return self._client.delete(f'/graph/{self.graph_time}/lsps/{name}').json()
+        return self._client.decode(self._client.delete(f'{self._url}/lsps/{name}'))
 
     def delete_lsps(self) -> Dict[str, Any]:
         """Delete all MPLS TE LSP tunnels attached to this graph."""
-        return self._client.delete(f'/graph/{self.graph_time}/lsps').json()
+        return self._client.decode(self._client.delete(f'{self._url}/lsps'))
 
     def cspf_path(
         self,
@@ -327,12 +330,12 @@ class Graph:
         if srlg_exclude:
             params['srlg_exclude'] = ','.join(str(value) for value in srlg_exclude)
         response = self._client.get(
-            f'/graph/{self.graph_time}/cspf-path/{node_a}/{node_b}', params=params)
-        return response.json()
+            f'{self._url}/cspf-path/{node_a}/{node_b}', params=params)
+        return self._client.decode(response)
     
     def delete(self) -> None:
         """Delete this graph."""
-        self._client.delete(f'/graph/{self.graph_time}')
+        self._client.graphs.delete(self.graph_time)
     
     def __repr__(self) -> str:
         return f"Graph(graph_time={self.graph_time}, protocol={self.protocol})"
@@ -341,13 +344,19 @@ class Graph:
 class GraphsManager:
     """Manager for graph resources."""
     
-    def __init__(self, client):
+    def __init__(self, client, cache_ttl: float = 0, cache_maxsize: int = 128):
         """Initialize the GraphsManager.
         
         Args:
             client: Topolograph client instance
+            cache_ttl: Seconds a get_by_time result is reused (default: 0, caching off)
+            cache_maxsize: Most graphs kept in the get_by_time cache; the least
+                recently used one is evicted first (default: 128)
         """
         self._client = client
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self._cache: 'OrderedDict[str, Tuple[float, Graph]]' = OrderedDict()
     
     def get(
         self,
@@ -382,7 +391,7 @@ class GraphsManager:
             params['name'] = name
 
         response = self._client.get('/graph/', params=params)
-        body = response.json()
+        body = self._client.decode(response)
         items = body.get('items', []) if isinstance(body, dict) else (body or [])
         if items:
             return Graph(self._client, items[0])
@@ -397,6 +406,7 @@ class GraphsManager:
         latest_only: bool = False,
         page: int = 1,
         per_page: int = 50,
+        fields: Optional[List[str]] = None,
     ) -> List[Graph]:
         """List graphs with optional filters.
 
@@ -408,10 +418,53 @@ class GraphsManager:
             latest_only: Return only the single newest graph among those matching the filters
             page: Page number, 1-indexed
             per_page: Items per page
+            fields: Only request these graph fields (e.g. ['graph_time', 'protocol']);
+                servers that do not support field selection return full graphs
 
         Returns:
             List of Graph objects (each exposing is_monitored and is_live)
         """
+        items = self._list_items(
+            protocol, area, is_monitored, name, latest_only, page, per_page, fields
+        )
+        return [Graph(self._client, g) for g in items]
+
+    def list_ids(
+        self,
+        protocol: Optional[str] = None,
+        area: Optional[str] = None,
+        is_monitored: Optional[bool] = None,
+        name: Optional[str] = None,
+        latest_only: bool = False,
+        page: int = 1,
+        per_page: int = 50,
+    ) -> List[str]:
+        """List only the graph_time of matching graphs.
+
+        Cheaper than list() for cleanup or iteration scripts: only the
+        graph_time field is requested and no Graph objects are built.
+        Takes the same filters as list().
+
+        Returns:
+            List of graph_time strings
+        """
+        items = self._list_items(
+            protocol, area, is_monitored, name, latest_only, page, per_page, ['graph_time']
+        )
+        return [g['graph_time'] for g in items]
+
+    def _list_items(
+        self,
+        protocol: Optional[str],
+        area: Optional[str],
+        is_monitored: Optional[bool],
+        name: Optional[str],
+        latest_only: bool,
+        page: int,
+        per_page: int,
+        fields: Optional[List[str]],
+    ) -> List[Dict[str, Any]]:
+        """Fetch one page of raw graph dicts for list() and list_ids()."""
         params: Dict[str, Any] = {'page': page, 'per_page': per_page}
         if protocol:
             params['protocol'] = protocol
@@ -423,11 +476,12 @@ class GraphsManager:
             params['name'] = name
         if latest_only:
             params['latest_only'] = True
+        if fields:
+            params['fields'] = ','.join(fields)
 
         response = self._client.get('/graph/', params=params)
-        body = response.json()
-        items = body.get('items', []) if isinstance(body, dict) else (body or [])
-        return [Graph(self._client, g) for g in items]
+        body = self._client.decode(response)
+        return body.get('items', []) if isinstance(body, dict) else (body or [])
     
     def get_by_time(self, graph_time: str) -> Graph:
         """Get a specific graph by graph_time.
@@ -438,11 +492,41 @@ class GraphsManager:
         Returns:
             Graph object
         
+        With a positive `cache_ttl`, results are reused for that many seconds.
+        A graph's content is fixed by its graph_time, but monitoring flags such
+        as is_live and is_monitored can change, so caching is opt-in.
+        
         Raises:
             NotFoundError: If graph not found
         """
+        now = time.monotonic()
+        cached = self._cache.get(graph_time)
+        if cached is not None and cached[0] > now:
+            self._cache.move_to_end(graph_time)
+            return cached[1]
+        
         response = self._client.get(f'/graph/{graph_time}')
-        return Graph(self._client, response.json())
+        graph = Graph(self._client, self._client.decode(response))
+        if self.cache_ttl > 0 and self.cache_maxsize > 0:
+            # Drop expired entries, then the least recently used beyond maxsize
+            for key in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+                del self._cache[key]
+            self._cache[graph_time] = (now + self.cache_ttl, graph)
+            self._cache.move_to_end(graph_time)
+            while len(self._cache) > self.cache_maxsize:
+                self._cache.popitem(last=False)
+        return graph
+    
+    def invalidate(self, graph_time: Optional[str] = None) -> None:
+        """Drop cached get_by_time results.
+        
+        Args:
+            graph_time: Graph to forget; all cached graphs if omitted
+        """
+        if graph_time is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(graph_time, None)
     
     def delete(self, graph_time: str) -> None:
         """Delete a graph by graph_time.
@@ -450,6 +534,7 @@ class GraphsManager:
         Args:
             graph_time: Graph time identifier
         """
+        self.invalidate(graph_time)
         self._client.delete(f'/graph/{graph_time}')
     
     def upload(
@@ -483,7 +568,7 @@ class GraphsManager:
             payload['graph_description'] = graph_description
 
         response = self._client.post('/graph/', json=payload)
-        return Graph(self._client, response.json())
+        return Graph(self._client, self._client.decode(response))
     
     def upload_multi(self, lsdb_array: List[Dict[str, Any]]) -> Graph:
         """Upload multiple LSDB files and create a new graph.
@@ -499,7 +584,7 @@ class GraphsManager:
             Graph object with diff information
         """
         response = self._client.post('/graphs', json=lsdb_array)
-        return Graph(self._client, response.json())
+        return Graph(self._client, self._client.decode(response))
     
     def upload_diagram(self, yaml_str: str) -> Graph:
         """Upload a YAML diagram and create a new graph.
@@ -522,7 +607,7 @@ class GraphsManager:
         """
         payload = {'yaml_diagram_str': yaml_str}
         response = self._client.post('/diagram', json=payload)
-        diagram_data = response.json()
+        diagram_data = self._client.decode(response)
         # DIAGRAM response has: url, graph_time, timestamp
         # Convert to Graph-compatible format
         graph_data = {
@@ -1,11 +1,16 @@
 """Network resource for Topolograph API."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 
+from ..exceptions import NotFoundError
+
 
 class Network:
     """Represents a network in a Topolograph graph."""
     
+    __slots__ = ('network', 'attributes')
+    
     def __init__(self, network: str, data: List[Dict[str, Any]]):
         """Initialize a Network object.
         
@@ -32,6 +37,7 @@ class NetworksManager:
         """
         self._client = client
         self.graph_time = graph_time
+        self._url = f'/network/{graph_time}'
     
     def find_by_ip(self, ip_address: str) -> List[Network]:
         """Find networks by IP address.
@@ -43,10 +49,10 @@ class NetworksManager:
             List of Network objects
         """
         response = self._client.get(
-            f'/network/{self.graph_time}',
+            self._url,
             params={'ip_address': ip_address}
         )
-        networks_data = response.json()
+        networks_data = self._client.decode(response)
         
         if not networks_data:
             return []
@@ -56,6 +62,37 @@ class NetworksManager:
             for network, attrs in networks_data.items()
         ]
     
+    def find_by_ips(
+        self, ip_addresses: List[str], max_workers: int = 8
+    ) -> Dict[str, List[Network]]:
+        """Find networks for several IP addresses with concurrent requests.
+        
+        The API has no batch lookup, so one find_by_ip request is made per
+        address. An address the API reports as not found maps to an empty list.
+        
+        Args:
+            ip_addresses: IP addresses to search for
+            max_workers: Maximum number of requests in flight (default: 8)
+        
+        Returns:
+            Dictionary mapping each IP address to its list of Network objects
+        
+        Raises:
+            APIError: The first failure other than not found (server errors,
+                timeouts, invalid addresses), as find_by_ip would raise it
+        """
+        if not ip_addresses:
+            return {}
+        
+        def lookup(ip_address: str) -> List[Network]:
+            try:
+                return self.find_by_ip(ip_address)
+            except NotFoundError:
+                return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ip_addresses))) as executor:
+            return dict(zip(ip_addresses, executor.map(lookup, ip_addresses)))
+    
     def find_by_network(self, network_with_mask: str) -> Optional[Network]:
         """Find a specific network by network/mask notation.
         
@@ -66,10 +103,10 @@ class NetworksManager:
             Network object or None if not found
         """
         response = self._client.get(
-            f'/network/{self.graph_time}',
+            self._url,
             params={'network_w_digit_mask': network_with_mask}
         )
-        networks_data = response.json()
+        networks_data = self._client.decode(response)
         
         if not networks_data or network_with_mask not in networks_data:
             return None
@@ -86,10 +123,10 @@ class NetworksManager:
             List of Network objects
         """
         response = self._client.get(
-            f'/network/{self.graph_time}',
+            self._url,
             params={'node_id': node_id}
         )
-        networks_data = response.json()
+        networks_data = self._client.decode(response)
         
         if not networks_data:
             return []
@@ -105,8 +142,8 @@ class NetworksManager:
         Returns:
             List of Network objects
         """
-        response = self._client.get(f'/network/{self.graph_time}')
-        networks_data = response.json()
+        response = self._client.get(self._url)
+        networks_data = self._client.decode(response)
         
         if not networks_data:
             return []
@@ -1,10 +1,18 @@
 """Node resource for Topolograph API."""
 
-from typing import Optional, List, Dict, Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator
 
 
 class Node:
-    """Represents a network node in a Topolograph graph."""
+    """Represents a network node in a Topolograph graph.
+    
+    Fields other than id and name are read from the raw API dict on demand,
+    either as attributes (``node.location``) or via ``node.attributes``.
+    """
+    
+    __slots__ = ('_data', 'id', 'name', '_attributes', '_manager')
     
     def __init__(self, data: Dict[str, Any], manager: Optional['NodesManager'] = None):
         """Initialize a Node object.
@@ -13,11 +21,35 @@ class Node:
             data: Node data from API
             manager: Optional NodesManager reference for update methods
         """
+        self._data = data
         self.id = data.get('id')
         self.name = data.get('name')
-        self.attributes = {k: v for k, v in data.items() if k not in ('id', 'name')}
+        self._attributes = None
         self._manager = manager
     
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """Node attributes other than id and name (built on first access)."""
+        if self._attributes is None:
+            self._attributes = {k: v for k, v in self._data.items() if k not in ('id', 'name')}
+        return self._attributes
+    
+    @attributes.setter
+    def attributes(self, value: Dict[str, Any]) -> None:
+        self._attributes = value
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not slots; private names are never
+        # node fields, and guarding them keeps copy/pickle from recursing
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+    
     def update(self, **attributes) -> 'Node':
         """Update this node's attributes (PUT - replaces all).
         
@@ -68,6 +100,8 @@ class NodesManager:
         """
         self._client = client
         self.graph_time = graph_time
+        self._url = f'/graph/{graph_time}/nodes'
+        self._diagram_url = f'/diagram/{graph_time}/nodes'
     
     def get(
         self,
@@ -109,8 +143,54 @@ class NodesManager:
             params['area'] = area
         params.update(query_params)
 
-        response = self._client.get(f'/graph/{self.graph_time}/nodes', params=params)
-        return response.json()
+        response = self._client.get(self._url, params=params)
+        return self._client.decode(response)
+    
+    def iter(
+        self,
+        batch_size: int = 500,
+        name: Optional[str] = None,
+        protocol: Optional[str] = None,
+        watcher: Optional[bool] = None,
+        area: Optional[str] = None,
+        **query_params
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all matching nodes, fetching one page at a time.
+
+        Only one page of nodes is held in memory, and the first nodes are
+        available as soon as the first page arrives.
+
+        Args:
+            batch_size: Nodes requested per page (default: 500)
+            name, protocol, watcher, area, **query_params: Same filters as `get`
+
+        Yields:
+            Node dictionaries, in the same shape as `get()['items']`
+        """
+        page = 1
+        yielded = 0
+        previous_items = None
+        while True:
+            body = self.get(
+                name=name, protocol=protocol, watcher=watcher, area=area,
+                page=page, per_page=batch_size, **query_params
+            )
+            items = body.get('items') or []
+            pagination = body.get('pagination') or {}
+            total_pages = pagination.get('total_pages')
+            if total_pages is None and items == previous_items:
+                return  # The server ignores `page`; this page was already yielded
+            yield from items
+            yielded += len(items)
+            if total_pages is not None:
+                # The server may clamp per_page, so a short page is not the end
+                if page >= total_pages or not items:
+                    return
+            elif (len(items) < batch_size
+                    or (pagination.get('total') is not None and yielded >= pagination['total'])):
+                return
+            previous_items = items
+            page += 1
     
     def get_by_id(self, node_id: int) -> Optional[Node]:
         """Get a specific node by ID.
@@ -122,14 +202,47 @@ class NodesManager:
             Node object or None if not found
         """
         try:
-            response = self._client.get(f'/diagram/{self.graph_time}/nodes/{node_id}')
-            node_data = response.json()
+            response = self._client.get(f'{self._diagram_url}/{node_id}')
+            node_data = self._client.decode(response)
             if isinstance(node_data, dict):
                 node_data['id'] = node_id
             return Node(node_data, manager=self)
         except Exception:
             return None
     
+    def get_many_by_ids(self, node_ids: List[int], max_workers: int = 8) -> List[Optional[Node]]:
+        """Get several nodes by ID with concurrent requests.
+        
+        Args:
+            node_ids: Node IDs to fetch
+            max_workers: Maximum number of requests in flight (default: 8)
+        
+        Returns:
+            List of Node objects in the order of node_ids, None for nodes
+            that could not be fetched (same as get_by_id)
+        """
+        if not node_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(node_ids))) as executor:
+            return list(executor.map(self.get_by_id, node_ids))
+    
+    async def get_many_by_ids_async(self, node_ids: List[int]) -> List[Optional[Node]]:
+        """Coroutine version of get_many_by_ids for callers inside an event loop.
+        
+        Requests run on the loop's default executor and are awaited together.
+        
+        Args:
+            node_ids: Node IDs to fetch
+        
+        Returns:
+            List of Node objects in the order of node_ids, None for nodes
+            that could not be fetched
+        """
+        loop = asyncio.get_running_loop()
+        return list(await asyncio.gather(
+            *[loop.run_in_executor(None, self.get_by_id, node_id) for node_id in node_ids]
+        ))
+    
     def update(self, node_id: int, attributes: Dict[str, Any]) -> Node:
         """Completely replace all attributes of a node (PUT).
         
@@ -146,7 +259,7 @@ class NodesManager:
             ValidationError: If request is invalid
         """
         response = self._client.put(
-            f'/diagram/{self.graph_time}/nodes/{node_id}',
+            f'{self._diagram_url}/{node_id}',
             json=attributes
         )
         # API returns success message, fetch updated node
@@ -168,7 +281,7 @@ class NodesManager:
             ValidationError: If request is invalid
         """
         response = self._client.patch(
-            f'/diagram/{self.graph_time}/nodes/{node_id}',
+            f'{self._diagram_url}/{node_id}',
             json=attributes
         )
         # API returns success message, fetch updated node
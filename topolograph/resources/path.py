@@ -1,20 +1,31 @@
 """Path resource for Topolograph API."""
 
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Sequence, Tuple
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn nested JSON lists into tuples."""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 
 class Path:
     """Represents a shortest path result."""
 
+    __slots__ = ('paths', 'cost', 'unbackup_paths', 'overload')
+
     def __init__(self, data: dict):
         """Initialize a Path object.
 
         Args:
             data: Path data from API
         """
-        self.paths = data.get('spt_path_nodes_name_as_ll_in_ll', [])
+        # Nested lists from the API are stored as (immutable, compact) tuples
+        self.paths = _freeze(data.get('spt_path_nodes_name_as_ll_in_ll') or [])
         self.cost = data.get('cost')
-        self.unbackup_paths = data.get('unbackup_paths_nodes_name_as_ll_in_ll', [])
+        self.unbackup_paths = _freeze(data.get('unbackup_paths_nodes_name_as_ll_in_ll') or [])
         self.overload = data.get('overload')
 
     def __repr__(self) -> str:
@@ -33,6 +44,7 @@ class PathsManager:
         """
         self._client = client
         self.graph_time = graph_time
+        self._url = f'/graph/{graph_time}'
 
     def shortest(self, src_node: str, dst_node: str, with_lsps: bool = False) -> Path:
         """Compute the shortest path between two nodes.
@@ -56,8 +68,33 @@ class PathsManager:
         """
         params = {'with_lsps': 'true'} if with_lsps else {}
         response = self._client.get(
-            f'/graph/{self.graph_time}/path/{src_node}/{dst_node}', params=params)
-        return Path(response.json())
+            f'{self._url}/path/{src_node}/{dst_node}', params=params)
+        return Path(self._client.decode(response))
+
+    def shortest_many(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        with_lsps: bool = False,
+        max_workers: int = 8,
+    ) -> List[Path]:
+        """Compute shortest paths for several node pairs with concurrent requests.
+
+        Args:
+            pairs: (src_node, dst_node) tuples
+            with_lsps: Same as for `shortest`, applied to every pair
+            max_workers: Maximum number of requests in flight (default: 8)
+
+        Returns:
+            List of Path objects in the order of pairs
+
+        Raises:
+            The first error raised by any of the `shortest` calls
+        """
+        if not pairs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            return list(executor.map(
+                lambda pair: self.shortest(pair[0], pair[1], with_lsps=with_lsps), pairs))
 
     def shortest_network(self, src_ip_or_network: str, dst_ip_or_network: str) -> Path:
         """Compute the shortest path between two IP addresses or networks.
@@ -73,25 +110,30 @@ class PathsManager:
             'src_ip_or_network': src_ip_or_network,
             'dst_ip_or_network': dst_ip_or_network,
         }
-        response = self._client.get(f'/graph/{self.graph_time}/path/network', params=params)
-        return Path(response.json())
+        response = self._client.get(f'{self._url}/path/network', params=params)
+        return Path(self._client.decode(response))
 
-    def edge_failure_reaction(self, failed_edges: List[Tuple[str, str]]) -> dict:
+    def edge_failure_reaction(self, failed_edges: Sequence[Sequence[str]]) -> dict:
         """Predict the whole-network impact if one or more links go down.
 
         Same shape as a node-failure prediction, for links instead of nodes.
 
         Args:
-            failed_edges: List of (src, dst) node-name tuples identifying each failed link
+            failed_edges: (src, dst) node-name pairs identifying each failed link;
+                a list of [src, dst] lists is sent without copying
 
         Returns:
             Dictionary with 'isGraphStillConnected', 'affectedLinks'
             (sptPathsIncreasedInPercent/sptPathsDecreasedInPercent), and
             'disjointedNodes' (list of node-name groups, if the graph split)
         """
+        # Lists of [src, dst] lists serialize as-is; only convert other shapes
+        if not (isinstance(failed_edges, list)
+                and (not failed_edges or isinstance(failed_edges[0], list))):
+            failed_edges = [[src, dst] for src, dst in failed_edges]
         payload = {
             'graph_time': self.graph_time,
-            'failed_edges_list': [[src, dst] for src, dst in failed_edges],
+            'failed_edges_list': failed_edges,
         }
         response = self._client.post('/network_reaction/edge_failure/', json=payload)
-        return response.json()
+        return self._client.decode(response)
@@ -1,13 +1,38 @@
 """Upload pipeline for raw LSDB data."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..client import Topolograph
 
+from ..exceptions import PartialUploadError
 from ..resources.graph import Graph
 
 
+# Map vendor names to API-expected format
+_VENDOR_MAP = {
+    'cisco': 'Cisco',
+    'juniper': 'Juniper',
+    'arista': 'Arista',
+    'nokia': 'Nokia',
+    'frr': 'FRR',
+    'quagga': 'Quagga',
+    'huawei': 'Huawei',
+    'bird': 'Bird',
+    'mikrotik': 'Mikrotik',
+    'paloalto': 'Paloalto',
+    'ubiquiti': 'Ubiquiti',
+    'alliedtelesis': 'AlliedTelesis',
+    'zte': 'ZTE',
+    'extreme': 'Extreme',
+    'ericsson': 'Ericsson',
+    'ruckus': 'Ruckus',
+    'fortinet': 'Fortinet'
+}
+_VENDOR_CANONICAL = frozenset(_VENDOR_MAP.values())
+
+
 class Uploader:
     """Handles uploading LSDB data to Topolograph."""
     
@@ -39,29 +64,7 @@ class Uploader:
         Returns:
             Graph object with diff information
         """
-        # Map vendor names to API-expected format
-        vendor_map = {
-            'cisco': 'Cisco',
-            'juniper': 'Juniper',
-            'arista': 'Arista',
-            'nokia': 'Nokia',
-            'frr': 'FRR',
-            'quagga': 'Quagga',
-            'huawei': 'Huawei',
-            'bird': 'Bird',
-            'mikrotik': 'Mikrotik',
-            'paloalto': 'Paloalto',
-            'ubiquiti': 'Ubiquiti',
-            'alliedtelesis': 'AlliedTelesis',
-            'zte': 'ZTE',
-            'extreme': 'Extreme',
-            'ericsson': 'Ericsson',
-            'ruckus': 'Ruckus',
-            'fortinet': 'Fortinet'
-        }
-        
-        # Normalize vendor name
-        vendor_normalized = vendor_map.get(vendor.lower(), vendor)
+        vendor_normalized = self._normalize_vendor(vendor)
         
         payload = {
             'lsdb_output': lsdb_text,
@@ -74,8 +77,56 @@ class Uploader:
             payload['graph_description'] = graph_description
 
         response = self._client.post('/graph/', json=payload)
-        return Graph(self._client, response.json())
+        return Graph(self._client, self._client.decode(response))
 
+    @staticmethod
+    def _normalize_vendor(vendor: str) -> str:
+        """Return the API spelling of a vendor name (unknown names pass through)."""
+        if vendor in _VENDOR_CANONICAL:
+            return vendor
+        return _VENDOR_MAP.get(vendor.lower(), vendor)
+    
+    def upload_many(self, items: List[Dict[str, Any]], max_workers: int = 8) -> List[Graph]:
+        """Upload several independent LSDBs in parallel, one graph per item.
+        
+        Each item is uploaded with its own `POST /graph/` request (see
+        upload_raw); requests run concurrently over the client's pooled
+        session. Use upload_multi to merge several LSDBs into a single graph.
+        
+        Args:
+            items: List of upload_raw keyword dictionaries, each with:
+                - lsdb_text: Raw LSDB text output
+                - vendor: Vendor name
+                - protocol: Protocol name (ospf, ospfv3, isis)
+                - watcher_name: Optional watcher name
+                - graph_description: Optional graph description
+            max_workers: Maximum number of uploads in flight (default: 8)
+        
+        Returns:
+            List of Graph objects in the order of items
+        
+        Raises:
+            PartialUploadError: If any upload failed, after all uploads have
+                finished; its `results` holds the Graph of every upload that
+                succeeded (and now exists on the server) and the exception of
+                every one that did not, in the order of items
+        """
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            futures = [executor.submit(self.upload_raw, **item) for item in items]
+        
+        results: List[Any] = []
+        for future in futures:
+            error = future.exception()
+            results.append(error if error is not None else future.result())
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            raise PartialUploadError(
+                f"{len(errors)} of {len(items)} uploads failed: {errors[0]}", results
+            )
+        return results
+    
     def upload_multi(self, lsdb_array: List[Dict[str, Any]]) -> Graph:
         """Upload multiple LSDB files to Topolograph.
         
@@ -90,4 +141,4 @@ class Uploader:
             Graph object with diff information
         """
         response = self._client.post('/graphs', json=lsdb_array)
-        return Graph(self._client, response.json())
+        return Graph(self._client, self._client.decode(response))